@@ -18,12 +18,42 @@ class TestTrafaret:
     def test_ensure(self):
         with pytest.raises(RuntimeError):
             t.ensure_trafaret(123)
+        assert t.ensure_trafaret(int) is t.ensure_trafaret(int)
+        assert t.ensure_trafaret(int).check('5') == 5
 
     def test_is_valid(self):
         string_trafaret = t.Float()
         assert string_trafaret.is_valid(1.5) == True
         assert string_trafaret.is_valid('foo') == False
 
+    def test_slots(self):
+        trafarets = [t.Int(), t.Null(), t.Int | t.Null, t.List(t.Int), t.Dict(a=t.Int), t.Key('a')]
+        for trafaret in trafarets:
+            assert not hasattr(trafaret, '__dict__')
+
+        class Custom(t.Int):
+            pass
+        custom = Custom()
+        custom.anything = 1
+        assert custom.check(1) == 1
+
+    def test_compile(self):
+        class Positive(t.Trafaret):
+            def check_value(self, value):
+                if value <= 0:
+                    self._failure('value is not positive', value=value)
+
+        compiled = Positive().compile()
+        assert compiled(5) == 5
+        with pytest.raises(t.DataError):
+            compiled(-1)
+        assert t.String().compile()(u'spam') == u'spam'
+        null = t.Null()
+        assert null.compile() is null.compile()
+        assert null.compile()(None) is None
+        with pytest.raises(NotImplementedError):
+            t.Trafaret().compile()(1)
+
 
 class TestAnyTrafaret:
     def test_any(self):
@@ -152,6 +182,21 @@ class TestDictTrafaret:
         res = extract_error(trafaret, {'a': 5, 'b': 7})
         assert res == {'b': 'b key was shadowed'}
 
+    def test_plain_and_custom_keys(self):
+        class UpperKey(t.Key):
+            def get_data(self, data, default):
+                return data.get(self.name, default).upper()
+
+        trafaret = t.Dict(
+            t.Key('a', to_name='b', default=lambda: 1, trafaret=t.Int),
+            UpperKey('c', trafaret=t.String),
+            t.Key('d', optional=True, trafaret=t.Int),
+        )
+        assert trafaret.check({'c': 'spam'}) == {'b': 1, 'c': 'SPAM'}
+        assert trafaret.check({'a': 2, 'c': 'x', 'd': 3}) == {'b': 2, 'c': 'X', 'd': 3}
+        res = extract_error(trafaret, {'a': 'x', 'd': 'y'})
+        assert res == {'a': "value can't be converted to int", 'c': 'is required', 'd': "value can't be converted to int"}
+
     def test_kwargs_extra(self):
         trafaret = t.Dict(t.Key('foo', trafaret=t.ToInt()), allow_extra=['eggs'])
         trafaret.check({"foo": 1, "eggs": None})
@@ -218,6 +263,14 @@ class TestDictTrafaret:
         with pytest.raises(t.DataError):
             third.check({"bar": 2, "bar1": 1, "marmalade": 5})
 
+    def test_add_keeps_operands(self):
+        first = t.Dict(t.Key('bar', trafaret=t.Int()), allow_extra=['eggs'])
+        second = t.Dict(t.Key('bar1', trafaret=t.Int()), allow_extra=['ham'])
+        third = first + second
+        assert first.extras == ['eggs']
+        assert second.extras == ['ham']
+        assert third.extras == ['eggs', 'ham']
+
     def test_callable_key(self):
         def simple_key(value):
             yield 'simple', 'simple data', []
@@ -347,6 +400,62 @@ class TestDictTrafaret:
             t.Dict({5: t.String})
         assert exc_info.value.args[0] == 'Non callable Keys are not supported'
 
+    def test_compile(self):
+        def simple_key(value):
+            yield 'simple', 'simple data', []
+
+        trafaret = t.Dict(
+            {t.Key('bar', default=u'nyanya') >> 'baz': t.String},
+            simple_key,
+            t.Key('spam', optional=True, trafaret=t.Int),
+            foo=t.ToInt,
+        )
+        check = trafaret.compile()
+        assert check is trafaret.compile()
+        res = check({'foo': '4'})
+        assert res == {'baz': u'nyanya', 'foo': 4, 'simple': 'simple data'}
+        res = extract_error(check, {'bar': 1, 'spam': 'a', 'eggs': 1})
+        assert res == {
+            'bar': 'value is not a string',
+            'spam': "value can't be converted to int",
+            'foo': 'is required',
+            'eggs': 'eggs is not allowed key',
+        }
+        res = extract_error(check, [])
+        assert res == 'value is not a dict'
+
+        check = trafaret.allow_extra('*', trafaret=t.String).compile()
+        res = extract_error(check, {'foo': 4, 'baz': u'spam', 'eggs': 1})
+        assert res == {'baz': 'baz key was shadowed', 'eggs': 'value is not a string'}
+        check = trafaret.allow_extra('eggs').ignore_extra('ham').compile()
+        res = check({'foo': 4, 'eggs': 1, 'ham': 2})
+        assert res == {'baz': u'nyanya', 'foo': 4, 'eggs': 1, 'simple': 'simple data'}
+
+    def test_compile_subclass(self):
+        class Stamped(t.Dict):
+            def transform(self, value, context=None):
+                res = super(Stamped, self).transform(value, context=context)
+                res['stamped'] = True
+                return res
+
+        trafaret = Stamped(a=t.Int)
+        assert trafaret.compile()({'a': 1}) == {'a': 1, 'stamped': True}
+        # subclass inside of standard container keeps its behaviour too
+        trafaret = t.List(Stamped(a=t.Int)) | t.Null
+        assert trafaret.compile()([{'a': 1}]) == [{'a': 1, 'stamped': True}]
+
+        class Checked(t.String):
+            def check(self, value, context=None):
+                return 'checked'
+
+        assert t.Tuple(Checked, t.Int & Checked).compile()([1, 2]) == ('checked', 'checked')
+
+    def test_extras_changed_before_check(self):
+        trafaret = t.Dict(a=t.Int)
+        trafaret.extras.append('b')
+        trafaret.ignore.append('c')
+        assert trafaret.check({'a': 1, 'b': 2, 'c': 3}) == {'a': 1, 'b': 2}
+
     def test_clone(self):
         d = t.Dict(t.Key('a', t.Int), ignore_extra='*')
         newd = d.ignore_extra('a')
@@ -372,6 +481,12 @@ class TestEnumTrafaret:
         res = extract_error(trafaret, 2)
         assert res == "value doesn't match any variant"
 
+    def test_unhashable(self):
+        trafaret = t.Enum("foo", [1, 2])
+        assert trafaret.check([1, 2]) == [1, 2]
+        assert t.Enum("foo", "bar").is_valid(["foo"]) is False
+        assert extract_error(trafaret, {}) == "value doesn't match any variant"
+
     def test_repr(self):
         trafaret = t.Enum("foo", "bar", 1)
         assert repr(trafaret), "<Enum('foo', 'bar', 1)>"
@@ -475,6 +590,31 @@ class TestList:
         res = extract_error(t.List(t.ToInt), ["a"])
         assert res == {0: "value can't be converted to int"}
 
+    def test_compile(self):
+        check = t.List(t.ToInt, max_length=2).compile()
+        assert check(['1', 2]) == [1, 2]
+        assert extract_error(check, ['a', 2]) == {0: "value can't be converted to int"}
+        assert extract_error(check, [1, 2, 3]) == 'list length is greater than 2'
+
+        class Sorted(t.List):
+            def transform(self, value, context=None):
+                return sorted(super(Sorted, self).transform(value, context=context))
+
+        assert Sorted(t.Int).compile()([3, 1]) == [1, 3]
+
+    def test_homogeneous(self):
+        assert t.List(t.Int).check([1, 2, True]) == [1, 2, True]
+        assert t.List(t.Float).check([1.5, 2.5]) == [1.5, 2.5]
+        assert t.List(t.Type[int]).check([1, 2]) == [1, 2]
+        assert t.List(t.String).check(['a', 'b']) == ['a', 'b']
+        assert t.List(t.String(allow_blank=True)).check(['a', '']) == ['a', '']
+        assert extract_error(t.List(t.String), ['a', '']) == {1: 'blank value is not allowed'}
+        assert extract_error(t.List(t.Int[:1]), [1, 2]) == {1: 'value is greater than 1'}
+        assert extract_error(t.List(t.Type[int]).compile(), [1, 'a']) == {1: 'value is not int'}
+        assert t.List(t.Bool).check([True, False]) == [True, False]
+        assert extract_error(t.List(t.Bool), [True, 1]) == {1: 'value should be True or False'}
+        assert t.List(t.Any).compile()([1, 'a']) == [1, 'a']
+
     def test_list_meta(self):
         with pytest.raises(RuntimeError) as exc_info:
             t.List[1:10]
@@ -559,6 +699,54 @@ class TestOrNotToTest:
         assert check(u'a') == u'a'
         assert check(5) == 5
 
+    def test_none(self):
+        assert (t.String | t.Null).check(None) is None
+        assert (t.Int | t.List(t.Int) | t.Null).compile()(None) is None
+        # ToBool accepts None, so it must be tried first
+        assert (t.ToBool | t.Null).check(None) is False
+
+        class NoneStr(t.String):
+            def check_and_return(self, value):
+                if value is None:
+                    return 'none!'
+                return super(NoneStr, self).check_and_return(value)
+
+        trafaret = NoneStr() | t.Null
+        for check in (trafaret.check, trafaret.compile()):
+            assert check(None) == 'none!'
+        res = extract_error(t.String | t.Null, 1)
+        assert res == {0: 'value is not a string', 1: 'value should be None'}
+
+    def test_compile(self):
+        trafaret = t.Int[1:5] | t.Null
+        check = trafaret.compile()
+        assert check is trafaret.compile()
+        assert check(3) == 3
+        assert check(None) is None
+        res = extract_error(check, 7)
+        assert res == {0: 'value is greater than 5', 1: 'value should be None'}
+
+    def test_skip_by_type(self):
+        class LaxString(t.String):
+            def check_and_return(self, value):
+                return str(value)
+
+        trafaret = t.Bool | t.String | t.Int
+        for check in (trafaret.check, trafaret.compile()):
+            assert check(5) == 5
+            assert check(True) is True
+            res = extract_error(check, [])
+            assert res == {0: {0: 'value should be True or False', 1: 'value is not a string'}, 1: 'value is not int'}
+            assert list(res[0]) == [0, 1]
+        # skipping is only a shortcut, alternative still gets its chance
+        trafaret = t.Null | LaxString()
+        for check in (trafaret.check, trafaret.compile()):
+            assert check(5) == '5'
+        # subclass may accept more than its base, it is never skipped
+        trafaret = LaxString() | t.Int
+        for check in (trafaret.check, trafaret.compile()):
+            assert check(5) == '5'
+
     def test_repr(self):
         null_string = t.Or(t.String, t.Null)
         assert repr(null_string) == '<Or(<String>, <Null>)>'
@@ -581,6 +769,11 @@ class TestAndTest:
         res = extract_error(ttt, 45)
         assert res == 'other error'
 
+    def test_compile(self):
+        check = (t.ToInt & (lambda v: v * 2)).compile()
+        assert check('4') == 8
+        assert extract_error(check, 'a') == "value can't be converted to int"
+
     def test_repr(self):
         assert repr(t.Bool & t.Null) == '<And(<Bool>, <Null>)>'
 
@@ -615,6 +808,14 @@ class TestToBoolTrafaret:
         res = extract_error(t.ToBool(), 'aloha')
         assert res == "value can't be converted to Bool"
 
+    def test_custom_values(self):
+        class Switch(t.ToBool):
+            true_values = t.ToBool.true_values | {'enabled'}
+            convertable = true_values | t.ToBool.false_values
+
+        assert Switch().check(' Enabled ') is True
+        assert Switch().check('off') is False
+
     def test_repr(self):
         assert repr(t.ToBool()) == '<ToBool>'
 
@@ -757,6 +958,20 @@ class TestRegexpTrafaret:
         res = extract_error(trafaret, None)
         assert res == 'value is not a string'
 
+    def test_memoized(self):
+        trafaret = t.Regexp('cat')
+        for _ in range(2):
+            assert trafaret('cat1212') == 'cat'
+            assert extract_error(trafaret, 'dog') == 'does not match pattern cat'
+        long_value = 'cat' * 1000
+        assert trafaret(long_value) == 'cat'
+        trafaret.cache_clear()
+        assert trafaret('cat1212') == 'cat'
+
+    def test_shared_pattern(self):
+        assert t.Regexp('cat').regexp is t.Regexp('cat').regexp
+        assert t.Hex().regexp is t.Hex().regexp
+
     def test_repr(self):
         assert repr(t.RegexpRaw('.*(cat).*')) == '<Regexp ".*(cat).*">'
 
@@ -789,6 +1004,25 @@ class TestTrafaretMeta:
         res = (t.ToInt >> (lambda v: v if v ** 2 > 15 else 0)).check(5)
         assert res == 5
 
+    def test_check_dispatch(self):
+        class Positive(t.Trafaret):
+            def check_value(self, value):
+                if value <= 0:
+                    self._failure('not positive')
+
+        class Doubled(Positive):
+            def check_and_return(self, value):
+                return value * 2
+
+        class Tripled(Doubled):
+            def transform(self, value, context=None):
+                return value * 3
+
+        assert Positive().check(2) == 2
+        assert extract_error(Positive(), 0) == 'not positive'
+        assert Doubled().check(2) == 2
+        assert Tripled().check(2) == 6
+
     def test_repr(self):
         res = t.ToInt | t.String
         assert repr(res) == '<Or(<ToInt>, <String>)>'
@@ -808,6 +1042,21 @@ class TestTupleTrafaret:
         res = extract_error(tup, [5])
         assert res == 'value must contain 3 items'
 
+    def test_compile(self):
+        tup = t.Tuple(t.ToInt, t.ToInt, t.String)
+        check = tup.compile()
+        assert check is tup.compile()
+        assert check([3, '4', u'5']) == (3, 4, u'5')
+        assert extract_error(check, ['a', 4, 5]) == {0: "value can't be converted to int", 2: 'value is not a string'}
+        assert extract_error(check, [5]) == 'value must contain 3 items'
+        assert t.Tuple().compile()([]) == ()
+
+        class Listed(t.Tuple):
+            def transform(self, value, context=None):
+                return list(super(Listed, self).transform(value, context=context))
+
+        assert Listed(t.Int).compile()([1]) == [1]
+
     def test_repr(self):
         tup = t.Tuple(t.ToInt, t.ToInt, t.String)
         assert repr(tup) == '<Tuple(<ToInt>, <ToInt>, <String>)>'
@@ -884,6 +1133,19 @@ class TestGuard:
         a = A()
         assert a.fn(a='123') == {'a': 123}
 
+    def test_positional_and_defaults(self):
+        class A(object):
+            def __len__(self):
+                return 0
+
+            @guard(a=t.ToInt, b=t.ToInt, c=t.String)
+            def fn(self, a, b=2, c='c'):
+                return self, a, b, c
+        a = A()
+        assert a.fn('1') == (a, 1, 2, 'c')
+        assert a.fn('1', '3', c='d') == (a, 1, 3, 'd')
+        assert a.fn('1', c='d') == (a, 1, 2, 'd')
+
     def test_args_checks(self):
         with pytest.raises(RuntimeError) as exc_info:
             @guard(123)
@@ -8,6 +8,19 @@ def test_with_context_caller():
     l.with_context_caller(l.with_context_caller(lambda x: x))
 
 
+def test_with_context_caller_callable_object():
+    class WithContext(object):
+        def __call__(self, value, context=None):
+            return value, context
+
+    class WithoutContext(object):
+        def __call__(self, value):
+            return value, None
+
+    assert l.with_context_caller(WithContext())(1, context=2) == (1, 2)
+    assert l.with_context_caller(WithoutContext())(1, context=2) == (1, None)
+    assert l.with_context_caller(WithContext())(3, context=4) == (3, 4)
+
 def test_get_callable_args():
     class A(object):
         def __init__(self, a):
@@ -44,6 +44,14 @@ class TestToDecimal:
     def test_repr(self, value, expected):
         assert repr(value) == expected
 
+    def test_bounds(self):
+        trafaret = t.ToDecimal[1:20]
+        assert trafaret.check('10.5') == Decimal('10.5')
+        assert t.extract_error(trafaret, '0.5') == 'value is less than 1'
+        assert t.extract_error(trafaret, Decimal(21)) == 'value is greater than 20'
+        assert t.extract_error(t.ToDecimal() < 3, '3') == 'value should be less than 3'
+        assert t.extract_error(t.ToDecimal() > 3, '3') == 'value should be greater than 3'
+
 
 class TestToInt:
     @pytest.mark.parametrize('value, expected', [
@@ -96,6 +104,24 @@ class TestToInt:
         res = t.extract_error(t.ToInt <= 3, 4)
         assert res == 'value is greater than 3'
 
+    def test_list_of_strings(self):
+        trafaret = t.List(t.ToInt)
+        assert trafaret.check(['1', '-2', '3']) == [1, -2, 3]
+        assert trafaret.check(['1', 2, 3.0]) == [1, 2, 3]
+        res = t.extract_error(trafaret, ['1', 'a', '1.0'])
+        assert res == {1: "value can't be converted to int", 2: "value can't be converted to int"}
+        res = t.extract_error(t.List(t.ToInt[1:]), ['1', '0'])
+        assert res == {1: 'value is less than 1'}
+
+    def test_compile(self):
+        check = (1 < t.ToInt).compile()
+        assert check('2') == 2
+        assert t.extract_error(check, '1') == 'value should be greater than 1'
+        assert t.extract_error(check, 'a') == "value can't be converted to int"
+        check = t.Int[1:10].compile()
+        assert check('5') == '5'
+        assert t.extract_error(check, 11) == 'value is greater than 10'
+
 
 def test_num_meta_repr():
     res = t.ToFloat[1:]
@@ -29,8 +29,21 @@ class TestUtils:
         assert fold({'form__a__b': 5, 'form__a__a__0': 4, 'form__a__a__1': 7}, 'form') == {'a': {'a': [4, 7], 'b': 5}}
         assert fold({'form__1__b': 5, 'form__0__a__0': 4, 'form__0__a__1': 7}, 'form') == [{'a': [4, 7]}, {'b': 5}]
 
+    def test_fold_list_order(self):
+        data = dict(('a__%s' % i, i) for i in range(12))
+        assert fold(data) == {'a': list(range(12))}
+        # sparse indexes are compacted in order
+        assert fold({'a__0': 1, 'a__5': 2, 'a__3': 3}) == {'a': [1, 3, 2]}
+        # digit that is not a number for `int`
+        assert fold({u'a__\u00b2': 1, u'a__1': 2}) == {u'a': [2, 1]}
+
     def test_unfold(self):
         assert unfold({'a': 4, 'b': 5}) == {'a': 4, 'b': 5}
         assert unfold({'a': [1, 2, 3]}) == {'a__0': 1, 'a__1': 2, 'a__2': 3}
         assert unfold({'a': {'a': 4, 'b': 5}}) == {'a__a': 4, 'a__b': 5}
         assert unfold({'a': {'a': 4, 'b': 5}}, 'form') == {'form__a__a': 4, 'form__a__b': 5}
+
+    def test_unfold_nested(self):
+        data = {'a': [{'b': 1}, (2, 3)], 'c': {}, 'd': 'e'}
+        assert unfold(data, delimeter='.') == {'a.0.b': 1, 'a.1.0': 2, 'a.1.1': 3, 'd': 'e'}
+        assert unfold(5, 'form') == {'form': 5}
@@ -0,0 +1,11 @@
+import asyncio
+
+
+def pytest_configure(config):
+    # uvloop is a drop-in replacement for default event loop,
+    # run async tests with it if it is installed
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,9 +1,11 @@
+import asyncio
 import pytest
 import trafaret as t
 
 
-# All test coroutines will be treated as marked.
-pytestmark = pytest.mark.asyncio
+# All test coroutines will be treated as marked. They share one event loop,
+# creating a loop for every test is much heavier than the checks themselves.
+pytestmark = pytest.mark.asyncio(loop_scope='module')
 
 
 async def check_int(value):
@@ -49,6 +51,100 @@ async def test_async_or():
         1: 'value should be None',
     }
 
+
+async def test_async_or_short_circuit():
+    calls = []
+
+    async def check_str(value):
+        calls.append(value)
+        return str(value)
+
+    trafaret = t.ToInt | check_str
+    assert (await trafaret.async_check('5')) == 5
+    assert calls == []
+    assert (await trafaret.async_check('a')) == 'a'
+    assert calls == ['a']
+
+
+async def test_async_or_skip_by_type():
+    trafaret = t.Or(t.Dict({t.Key('a'): check_int}), t.String, t.ToInt & check_int)
+    assert trafaret.is_async
+    assert (await trafaret.async_check({'a': 1})) == {'a': 1}
+    assert (await trafaret.async_check('5')) == '5'
+    assert (await trafaret.async_check(5)) == 5
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check(None)
+    assert res.value.as_dict() == {
+        0: 'value is not a dict',
+        1: 'value is not a string',
+        2: 'value is not int',
+    }
+
+    class LaxString(t.String):
+        def check_and_return(self, value):
+            return str(value)
+
+    trafaret = LaxString() | (t.ToInt & check_int)
+    assert (await trafaret.async_check(5)) == '5'
+
+
+async def test_async_flag():
+    assert not (t.ToInt | t.Null).is_async
+    assert not (t.ToInt & int).is_async
+    assert (t.ToInt & check_int).is_async
+    assert (t.Null | (t.ToInt & check_int)).is_async
+    assert not t.Dict(a=t.Int, b=t.List(t.String)).is_async
+    assert t.Dict(a=t.Int, b=t.Tuple(t.Int, check_int)).is_async
+    assert t.Mapping(t.String, check_int).is_async
+    assert not t.Call(lambda value: value).is_async
+
+
+async def test_own_async_check():
+    class DbCheck(t.Trafaret):
+        def check_value(self, value):
+            pass
+
+        async def async_check(self, value, context=None):
+            return 'from-db'
+
+    assert DbCheck().is_async
+    assert (await (t.Int & DbCheck()).async_check(1)) == 'from-db'
+    assert (await (t.Null | DbCheck()).async_check(1)) == 'from-db'
+    assert (await t.List(DbCheck()).async_check([1])) == ['from-db']
+    assert (await t.Dict(a=DbCheck()).async_check({'a': 1})) == {'a': 'from-db'}
+
+
+async def test_own_async_transform():
+    class MyDict(t.Dict):
+        async def async_transform(self, value, context=None):
+            return {'overridden': True}
+
+    class MyList(t.List):
+        async def async_transform(self, value, context=None):
+            return ['overridden']
+
+    class MyOr(t.Or):
+        async def async_transform(self, value, context=None):
+            return 'overridden'
+
+    class MyForward(t.Forward):
+        async def async_transform(self, value, context=None):
+            return 'fwd-overridden'
+
+    forward = MyForward()
+    forward << t.Int
+    assert (await MyDict(a=t.Int).async_check({'a': 1})) == {'overridden': True}
+    assert (await MyList(t.Int).async_check([1])) == ['overridden']
+    assert (await MyOr(t.Int, t.Null).async_check(1)) == 'overridden'
+    assert (await forward.async_check(1)) == 'fwd-overridden'
+
+    # subclass that keeps async part of its base is still sync
+    class SyncDict(t.Dict):
+        pass
+
+    assert not SyncDict(a=t.Int).is_async
+
+
 async def test_async_call():
     trafaret = t.ToInt & int & check_int
     res = await (trafaret.async_check('5'))
@@ -75,6 +171,41 @@ async def test_dict():
     assert res.value.as_dict() == {'b': 'is required'}
 
 
+async def test_dict_keys_run_concurrently():
+    calls = []
+
+    async def check(value):
+        calls.append(('start', value))
+        await asyncio.sleep(0)
+        calls.append(('end', value))
+        return value
+
+    trafaret = t.Dict(a=check, b=check)
+    res = await trafaret.async_check({'a': 1, 'b': 2})
+    assert res == {'a': 1, 'b': 2}
+    assert [step for step, _ in calls] == ['start', 'start', 'end', 'end']
+
+
+async def test_dict_extras_run_concurrently():
+    calls = []
+
+    async def check(value):
+        calls.append('start')
+        await asyncio.sleep(0)
+        calls.append('end')
+        if value < 0:
+            return t.DataError('negative')
+        return value
+
+    trafaret = t.Dict(a=t.Int).allow_extra('*', trafaret=check)
+    res = await trafaret.async_check({'a': 1, 'b': 2, 'c': 3})
+    assert res == {'a': 1, 'b': 2, 'c': 3}
+    assert calls == ['start', 'start', 'end', 'end']
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check({'a': 1, 'b': -2, 'c': 3})
+    assert res.value.as_dict() == {'b': 'negative'}
+
+
 async def test_sync_key():
     def simple_key(value):
         yield 'simple', 'simple data', []
@@ -92,6 +223,25 @@ async def test_sync_key():
     assert res.value.as_dict() == {'simple': 'bad key here'}
 
 
+async def test_async_gen_key():
+    async def agen_key(value):
+        yield 'x', value['x'], ('x',)
+
+    trafaret = t.Dict(agen_key)
+    assert trafaret.is_async
+    assert (await trafaret.async_check({'x': 1})) == {'x': 1}
+
+
+async def test_key_with_own_async_call():
+    class AsyncKey(t.Key):
+        async def async_call(self, data, context=None):
+            yield self.name, 'from-async', (self.name,)
+
+    trafaret = t.Dict({AsyncKey('a'): t.Any})
+    assert trafaret.is_async
+    assert (await trafaret.async_check({'a': 1})) == {'a': 'from-async'}
+
+
 async def test_dict_extra_and_ignore():
     trafaret = t.Dict(
         t.Key('a', to_name='A', trafaret=t.String),
@@ -141,6 +291,36 @@ async def test_list():
     assert res.value.as_dict() == {0: "value can't be converted to int"}
 
 
+async def test_list_items_run_concurrently():
+    calls = []
+
+    async def check(value):
+        calls.append('start')
+        await asyncio.sleep(0)
+        calls.append('end')
+        if value < 0:
+            return t.DataError('negative')
+        return value
+
+    trafaret = t.List(check)
+    assert trafaret.is_async
+    res = await trafaret.async_check([1, 2])
+    assert res == [1, 2]
+    assert calls == ['start', 'start', 'end', 'end']
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check([-1, 2, -3])
+    assert res.value.as_dict() == {0: 'negative', 2: 'negative'}
+
+
+async def test_sync_list():
+    trafaret = t.List(t.ToInt)
+    assert not trafaret.is_async
+    assert await trafaret.async_check(['1', 2]) == [1, 2]
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check(['a'])
+    assert res.value.as_dict() == {0: "value can't be converted to int"}
+
+
 async def test_tuple():
     trafaret = t.Tuple(t.Null, t.ToInt & check_int)
     res = await (trafaret.async_check([None, '5']))
@@ -150,6 +330,36 @@ async def test_tuple():
     assert res.value.as_dict() == {1: "value can't be converted to int"}
 
 
+async def test_tuple_items_run_concurrently():
+    calls = []
+
+    async def check(value):
+        calls.append('start')
+        await asyncio.sleep(0)
+        calls.append('end')
+        return value
+
+    trafaret = t.Tuple(check, t.ToInt, check)
+    res = await trafaret.async_check([1, '2', 3])
+    assert res == (1, 2, 3)
+    assert calls == ['start', 'start', 'end', 'end']
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check([1, 'a', 3])
+    assert res.value.as_dict() == {1: "value can't be converted to int"}
+
+
+async def test_dict_sync_keys_and_extras():
+    trafaret = t.Dict({t.Key('a'): t.ToInt, t.Key('b'): check_int}).allow_extra('*', trafaret=t.ToInt)
+    res = await trafaret.async_check({'a': '1', 'b': 2, 'c': '3'})
+    assert res == {'a': 1, 'b': 2, 'c': 3}
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check({'a': 'x', 'b': 2, 'c': 'y'})
+    assert res.value.as_dict() == {
+        'a': "value can't be converted to int",
+        'c': "value can't be converted to int",
+    }
+
+
 async def test_mapping():
     trafaret = t.Mapping(t.String, t.ToInt & check_int)
     res = await (trafaret.async_check({'a': '5'}))
@@ -168,6 +378,29 @@ async def test_mapping():
     assert res.value.as_dict() == "value is not a dict"
 
 
+async def test_mapping_items_run_concurrently():
+    calls = []
+
+    async def check(value):
+        calls.append('start')
+        await asyncio.sleep(0)
+        calls.append('end')
+        if value < 0:
+            return t.DataError('negative')
+        return value
+
+    trafaret = t.Mapping(t.String, check)
+    res = await trafaret.async_check({'a': 1, 'b': 2})
+    assert res == {'a': 1, 'b': 2}
+    assert calls == ['start', 'start', 'end', 'end']
+    with pytest.raises(t.DataError) as res:
+        await trafaret.async_check({'a': -1, None: -2, 'c': 3})
+    assert res.value.as_dict() == {
+        'a': {'value': 'negative'},
+        None: {'key': 'value is not a string', 'value': 'negative'},
+    }
+
+
 async def test_forward():
     trafaret = t.Forward()
     trafaret << t.List(t.ToInt & check_int)
@@ -175,6 +408,47 @@ async def test_forward():
     assert res == [5]
 
 
+async def test_recursive_forward():
+    node = t.Forward()
+    children = t.List(node)
+    node << t.Dict(name=t.String, children=children)
+    assert not node.is_async
+    assert not children.is_async
+    tree = {'name': 'leaf', 'children': []}
+    for _ in range(30):
+        tree = {'name': 'node', 'children': [tree]}
+    assert (await node.async_check(tree)) == tree
+
+    node = t.Forward()
+    children = t.List(node)
+    node << t.Dict(name=t.String, children=children, id=t.ToInt & check_int)
+    assert node.is_async
+    assert children.is_async
+    res = await node.async_check({'name': 'a', 'id': '1', 'children': [
+        {'name': 'b', 'id': '2', 'children': []},
+    ]})
+    assert res['children'][0]['id'] == 2
+
+
+async def test_recursive_forward_inspected_concurrently():
+    # `is_async` asked for a schema part while the same schema is being
+    # inspected, as it happens when two threads check it first time
+    answers = []
+
+    class Probe(t.Any):
+        def _detect_async(self, seen):
+            if not answers:
+                answers.append(None)
+                answers.append(children.is_async)
+            return False
+
+    node = t.Forward()
+    children = t.List(node)
+    node << t.Dict(probe=Probe(), children=children, id=t.ToInt & check_int)
+    assert node.is_async
+    assert answers == [None, True]
+
+
 async def test_not_set_forward():
     trafaret = t.Forward()
     with pytest.raises(t.DataError) as res:
@@ -7,77 +7,225 @@ from .lib import (
 from . import codes
 
 
+def gather(*aws, **kwargs):
+    # asyncio is surely imported when coroutines run, importing it here
+    # keeps `import trafaret` cheap for sync only code
+    import asyncio
+    return asyncio.gather(*aws, **kwargs)
+
+
+async def collect_async_gen(agen):
+    return [item async for item in agen]
+
+
+def key_is_async(key, seen=None):
+    # plain async generator is a key too, custom keys without `is_async`
+    # are async if they have `async_call`
+    if inspect.isasyncgenfunction(key) or inspect.isasyncgenfunction(getattr(key, '__call__', None)):
+        return True
+    if seen is not None and hasattr(key, '_check_async'):
+        return key._check_async(seen)
+    return getattr(key, 'is_async', hasattr(key, 'async_call'))
+
+
+def check_or_error(trafaret, value, context=None):
+    try:
+        return trafaret(value, context=context)
+    except DataError as err:
+        return err
+
+
 class TrafaretAsyncMixin:
+    __slots__ = ('_is_async',)
+
     async def async_check(self, value, context=None):
+        # fully sync schema is checked right here, without awaiting
+        # a coroutine for every trafaret in it
+        if not self.is_async:
+            return self.check(value, context=context)
         if hasattr(self, 'async_transform'):
             return (await self.async_transform(value, context=context))
         return self.check(value, context=context)
 
+    @property
+    def is_async(self):
+        """
+        Tells if `async_check` can actually await something. Async composites
+        call sync children directly, without a coroutine per child.
+        Trafarets are immutable, so it is computed once.
+        """
+        is_async = getattr(self, '_is_async', None)
+        if is_async is None:
+            # inside of a recursive schema a negative answer is provisional,
+            # only the outermost call sees the whole schema and is cached
+            is_async = self._is_async = self._check_async(set())
+        return is_async
+
+    def _check_async(self, seen):
+        """
+        `is_async` of a trafaret met while the schema is inspected, `seen`
+        holds ids of `Forward`s already on the way, so recursion stops on them.
+        State is passed in arguments, concurrent inspections do not mix.
+        """
+        is_async = getattr(self, '_is_async', None)
+        if is_async is not None:
+            return is_async
+        cls = type(self)
+        # user trafaret may await anything in its own `async_check`, or in
+        # `async_transform` of a subclass, children tell nothing then
+        if cls.async_check is not TrafaretAsyncMixin.async_check:
+            return True
+        async_transform = getattr(cls, 'async_transform', None)
+        if async_transform is not None and not getattr(cls, '_trusted_hints', False) \
+                and getattr(async_transform, '__module__', None) != __name__:
+            return True
+        # composite mixins come after this one in MRO, so their
+        # `_detect_async` can not be overridden from here
+        if hasattr(self, '_detect_async'):
+            return self._detect_async(seen)
+        return hasattr(self, 'async_transform')
+
 
 class OrAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, value, context=None):
-        errors = []
-        for trafaret in self.trafarets:
+        if value is None and self._none_matches:
+            return None
+        errors = {}
+        for idx, (trafaret, types) in enumerate(self._alternatives):
+            # alternative of wrong type fails on its type check, before
+            # anything async, so `_nothing_match` gets its error in sync
+            if types is not None and not isinstance(value, types):
+                errors[idx] = None
+                continue
             try:
-                return (await trafaret.async_check(value, context=context))
+                if trafaret.is_async:
+                    return (await trafaret.async_check(value, context=context))
+                return trafaret(value, context=context)
             except DataError as e:
-                errors.append(e)
-        self._failure(dict(enumerate(errors)), code=codes.NOTHING_MATCH)
+                errors[idx] = e
+        return self._nothing_match(errors, value, context=context)
+
+    def _detect_async(self, seen):
+        return any(trafaret._check_async(seen) for trafaret in self.trafarets)
 
 
 class AndAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, value, context=None):
-        res = await self.trafaret.async_check(value, context=context)
-        res = await self.other.async_check(res, context=context)
+        if self.trafaret.is_async:
+            res = await self.trafaret.async_check(value, context=context)
+        else:
+            res = self.trafaret(value, context=context)
+        if self.other.is_async:
+            res = await self.other.async_check(res, context=context)
+        else:
+            res = self.other(res, context=context)
         return res
 
+    def _detect_async(self, seen):
+        return self.trafaret._check_async(seen) or self.other._check_async(seen)
+
 
 class ListAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, value, context=None):
         self.check_common(value)
+        results = await gather(
+            *(self.trafaret.async_check(item, context=context) for item in value),
+            return_exceptions=True
+        )
         lst = []
         errors = {}
-        for index, item in enumerate(value):
-            try:
-                lst.append(await self.trafaret.async_check(item, context=context))
-            except DataError as err:
-                errors[index] = err
+        for index, result in enumerate(results):
+            if isinstance(result, DataError):
+                errors[index] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                lst.append(result)
         if errors:
             self._failure(error=errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return lst
 
+    def _detect_async(self, seen):
+        return self.trafaret._check_async(seen)
+
 
 class TupleAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, value, context=None):
         self.check_common(value)
+        # sync items are checked in place, async ones are gathered at once
         result = []
-        errors = {}
-        for idx, (item, trafaret) in enumerate(zip(value, self.trafarets)):
-            try:
-                result.append(await trafaret.async_check(item, context=context))
-            except DataError as err:
-                errors[idx] = err
+        slots = []
+        checks = []
+        for item, trafaret in zip(value, self.trafarets):
+            if trafaret.is_async:
+                slots.append(len(result))
+                checks.append(trafaret.async_check(item, context=context))
+                result.append(None)
+            else:
+                result.append(check_or_error(trafaret, item, context=context))
+        if checks:
+            checked = await gather(*checks, return_exceptions=True)
+            for slot, res in zip(slots, checked):
+                if isinstance(res, BaseException) and not isinstance(res, DataError):
+                    raise res
+                result[slot] = res
+        errors = {
+            idx: res
+            for idx, res in enumerate(result)
+            if isinstance(res, DataError)
+        }
         if errors:
             self._failure(errors, value=value, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return tuple(result)
 
+    def _detect_async(self, seen):
+        return any(trafaret._check_async(seen) for trafaret in self.trafarets)
+
 
 class MappingAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, mapping, context=None):
-        if not isinstance(mapping, AbcMapping):
+        if type(mapping) is not dict and not isinstance(mapping, AbcMapping):
             self._failure("value is not a dict", value=mapping, code=codes.IS_NOT_A_DICT)
+        items = list(mapping.items())
+        # results go key, value, key, value...; all async checks of the
+        # mapping are gathered at once and put to their slots afterwards
+        results = []
+        slots = []
+        checks = []
+        for key, value in items:
+            for trafaret, item in ((self.key, key), (self.value, value)):
+                if trafaret.is_async:
+                    slots.append(len(results))
+                    checks.append(trafaret.async_check(item, context=context))
+                    results.append(None)
+                else:
+                    results.append(check_or_error(trafaret, item, context=context))
+        if checks:
+            checked = await gather(*checks, return_exceptions=True)
+            for slot, result in zip(slots, checked):
+                if isinstance(result, BaseException) and not isinstance(result, DataError):
+                    raise result
+                results[slot] = result
         checked_mapping = {}
         errors = {}
-        for key, value in mapping.items():
+        for idx, (key, value) in enumerate(items):
+            checked_key = results[2 * idx]
+            checked_value = results[2 * idx + 1]
             pair_errors = {}
-            try:
-                checked_key = await self.key.async_check(key, context=context)
-            except DataError as err:
-                pair_errors['key'] = err
-            try:
-                checked_value = await self.value.async_check(value, context=context)
-            except DataError as err:
-                pair_errors['value'] = err
+            if isinstance(checked_key, DataError):
+                pair_errors['key'] = checked_key
+            if isinstance(checked_value, DataError):
+                pair_errors['value'] = checked_value
             if pair_errors:
                 errors[key] = DataError(error=pair_errors, code=codes.PAIR_MEMBERS_DID_NOT_MATCH)
             else:
@@ -86,11 +234,17 @@ class MappingAsyncMixin:
             self._failure(error=errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return checked_mapping
 
+    def _detect_async(self, seen):
+        return self.key._check_async(seen) or self.value._check_async(seen)
+
 
 class CallAsyncMixin:
+    __slots__ = ()
+
+    def _detect_async(self, seen):
+        return inspect.iscoroutinefunction(self.fn)
+
     async def async_transform(self, value, context=None):
-        if not inspect.iscoroutinefunction(self.fn):
-            return self.transform(value, context=context)
         if self.supports_context:
             res = await self.fn(value, context=context)
         else:
@@ -102,63 +256,128 @@ class CallAsyncMixin:
 
 
 class ForwardAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, value, context=None):
         if self.trafaret is None:
             self._failure('trafaret not set yet', value=value, code=codes.TRAFARET_IS_NOT_SET)
         return (await self.trafaret.async_check(value, context=context))
 
+    def _detect_async(self, seen):
+        if self.trafaret is None:
+            return True
+        # the schema is async only if some async trafaret is reachable,
+        # so the recursion back to this Forward adds nothing
+        if id(self) in seen:
+            return False
+        seen.add(id(self))
+        return self.trafaret._check_async(seen)
+
 
 class DictAsyncMixin:
+    __slots__ = ()
+
     async def async_transform(self, value, context=None):
-        if not isinstance(value, AbcMapping):
+        if type(value) is not dict and not isinstance(value, AbcMapping):
             self._failure("value is not a dict", value=value, code=codes.IS_NOT_A_DICT)
         collect = {}
         errors = {}
-        touched_names = []
-        for key in self._keys:
-            key_run = getattr(key, 'async_call', key)(
-                value,
-                context=context,
-            )
-            if inspect.isasyncgen(key_run):
-                async for k, v, names in key_run:
-                    if isinstance(v, DataError):
-                        errors[k] = v
-                    else:
-                        collect[k] = v
-                    touched_names.extend(names)
-            else:
-                for k, v, names in key_run:
-                    if isinstance(v, DataError):
-                        errors[k] = v
-                    else:
-                        collect[k] = v
-                    touched_names.extend(names)
+        touched_names = set()
+        # keys do not depend on each other, so async keys run concurrently
+        # and results are merged in keys order afterwards
+        key_runs = []
+        async_runs = []
+        for caller, is_async in self._async_keys():
+            key_run = caller(value, context=context)
+            if is_async and inspect.isasyncgen(key_run):
+                async_runs.append((len(key_runs), collect_async_gen(key_run)))
+            key_runs.append(key_run)
+        if async_runs:
+            results = await gather(*(run for _, run in async_runs))
+            for (idx, _), result in zip(async_runs, results):
+                key_runs[idx] = result
+        for key_run in key_runs:
+            for k, v, names in key_run:
+                if isinstance(v, DataError):
+                    errors[k] = v
+                else:
+                    collect[k] = v
+                touched_names.update(names)
 
+        extras = []
+        extras_async = self.extras_trafaret.is_async
         if not self.ignore_any:
+            extras_set, ignore_set = self._extra_sets()
             for key in value:
                 if key in touched_names:
                     continue
-                if key in self.ignore:
+                if key in ignore_set:
                     continue
-                if not self.allow_any and key not in self.extras:
+                if not self.allow_any and key not in extras_set:
                     if key in collect:
                         errors[key] = DataError("%s key was shadowed" % key, code=codes.SHADOWED)
                     else:
                         errors[key] = DataError("%s is not allowed key" % key, code=codes.NOT_ALLOWED)
                 elif key in collect:
                     errors[key] = DataError("%s key was shadowed" % key, code=codes.SHADOWED)
+                elif extras_async:
+                    extras.append(key)
                 else:
                     try:
-                        collect[key] = await self.extras_trafaret.async_check(value[key])
+                        collect[key] = self.extras_trafaret(value[key])
                     except DataError as de:
                         errors[key] = de
+        # extra keys do not depend on each other too
+        if extras:
+            results = await gather(
+                *(self.extras_trafaret.async_check(value[key]) for key in extras),
+                return_exceptions=True
+            )
+            for key, result in zip(extras, results):
+                if isinstance(result, DataError):
+                    errors[key] = result
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    collect[key] = result
         if errors:
             self._failure(error=errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return collect
 
+    def _async_keys(self):
+        """
+        Pairs of key caller and flag if the key is async, only results of
+        async keys can be async generators. Keys are fixed after
+        construction, so pairs are made on first use.
+        """
+        async_keys = getattr(self, '_async_key_runs', None)
+        if async_keys is None:
+            async_keys = []
+            for key, key_caller in zip(self.keys, self._keys):
+                is_async = key_is_async(key)
+                if is_async:
+                    key_caller = getattr(key_caller, 'async_call', key_caller)
+                async_keys.append((key_caller, is_async))
+            async_keys = self._async_key_runs = tuple(async_keys)
+        return async_keys
+
+    def _detect_async(self, seen):
+        return self.extras_trafaret._check_async(seen) or any(key_is_async(key, seen) for key in self.keys)
+
 
 class KeyAsyncMixin:
+    __slots__ = ()
+
+    @property
+    def is_async(self):
+        return self._check_async(set())
+
+    def _check_async(self, seen):
+        # subclass with its own `async_call` may await anything there
+        if type(self).async_call is not KeyAsyncMixin.async_call:
+            return True
+        return self.trafaret._check_async(seen)
+
     async def async_call(self, data, context=None):
         if self.name in data or self.default is not _empty:
             if callable(self.default):
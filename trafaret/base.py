@@ -3,6 +3,7 @@
 import functools
 import itertools
 import warnings
+import weakref
 from datetime import date, datetime
 from .lib import (
     py3,
@@ -11,6 +12,7 @@ from .lib import (
     getargspec,
     get_callable_args,
     with_context_caller,
+    compile_function,
     _empty,
     STR_TYPES,
     AbcMapping,
@@ -35,7 +37,7 @@ if py36:
     )
 else:  # pragma: no cover
     class EmptyMixin(object):
-        pass
+        __slots__ = ()
     TrafaretAsyncMixin = EmptyMixin
     OrAsyncMixin = EmptyMixin
     AndAsyncMixin = EmptyMixin
@@ -69,6 +71,12 @@ Look at doctests for usage examples
 """
 
 
+# implementation methods `Trafaret.check` can dispatch to
+CHECK_TRANSFORM = 1
+CHECK_VALUE = 2
+CHECK_AND_RETURN = 3
+
+
 class TrafaretMeta(type):
     """
     Metaclass for trafarets to make using "|" operator possible not only
@@ -82,6 +90,21 @@ class TrafaretMeta(type):
     5
     """
 
+    def __init__(cls, name, bases, namespace):
+        super(TrafaretMeta, cls).__init__(name, bases, namespace)
+        # `check` dispatch is resolved once per class, not on every call
+        if hasattr(cls, 'transform'):
+            cls._check_impl = CHECK_TRANSFORM
+        elif hasattr(cls, 'check_value'):
+            cls._check_impl = CHECK_VALUE
+        elif hasattr(cls, 'check_and_return'):
+            cls._check_impl = CHECK_AND_RETURN
+        else:
+            cls._check_impl = None
+        # hints like `_accepted_types` hold for trafarets of this package,
+        # subclass from elsewhere may accept more than its base declares
+        cls._trusted_hints = cls.__module__.split('.')[0] == 'trafaret'
+
     def __or__(cls, other):
         return cls() | other
 
@@ -100,19 +123,26 @@ class Trafaret(TrafaretAsyncMixin):
     """
 
     __metaclass__ = TrafaretMeta
+    __slots__ = ('_compiled', '__weakref__')
+    # set for trafarets that never accept None, so `Or` can skip them
+    _rejects_none = False
+    # types of values trafaret can ever accept, if known, `Or` tries
+    # alternative only for these, without raising DataError for others
+    _accepted_types = None
 
     def check(self, value, context=None):
         """
         Common logic. In subclasses you need to implement check_value or
         check_and_return.
         """
-        if hasattr(self, 'transform'):
+        impl = self._check_impl
+        if impl == CHECK_TRANSFORM:
             return self.transform(value, context=context)
-        elif hasattr(self, 'check_value'):
+        elif impl == CHECK_AND_RETURN:
+            return self.check_and_return(value)
+        elif impl == CHECK_VALUE:
             self.check_value(value)
             return value
-        elif hasattr(self, 'check_and_return'):
-            return self.check_and_return(value)
         else:
             cls = "{}.{}".format(
                 type(self).__module__,
@@ -123,6 +153,37 @@ class Trafaret(TrafaretAsyncMixin):
                 " check_and_return methods '%s'" % cls
             )
 
+    def compile(self):
+        """
+        Returns function with the same behaviour as `check`. Composite
+        trafarets generate it with compiled children bound in, for others
+        it calls implementation method directly, without `check` dispatch.
+        """
+        # `!=`, not `is`, unbound methods are new objects on python 2
+        if type(self).check != Trafaret.check:
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        impl = self._check_impl
+        if impl == CHECK_TRANSFORM:
+            compiled = self.transform
+        elif impl == CHECK_VALUE:
+            check_value = self.check_value
+
+            def compiled(value, context=None):
+                check_value(value)
+                return value
+        elif impl == CHECK_AND_RETURN:
+            check_and_return = self.check_and_return
+
+            def compiled(value, context=None):
+                return check_and_return(value)
+        else:
+            return self.check
+        self._compiled = compiled
+        return compiled
+
     def is_valid(self, value):
         """
         Allows to check value and get bool, is value valid or not.
@@ -153,6 +214,8 @@ class Trafaret(TrafaretAsyncMixin):
 
 
 class OnError(Trafaret):
+    __slots__ = ['trafaret', 'message', 'code']
+
     def __init__(self, trafaret, message, code=None):
         self.trafaret = ensure_trafaret(trafaret)
         self.message = message
@@ -171,6 +234,8 @@ class OnError(Trafaret):
 
 
 class WithRepr(Trafaret):
+    __slots__ = ['trafaret', 'representation']
+
     def __init__(self, trafaret, representation):
         self.trafaret = ensure_trafaret(trafaret)
         self.representation = representation
@@ -182,6 +247,10 @@ class WithRepr(Trafaret):
         return self.representation
 
 
+# `Call` wrappers for plain classes like `int`, shared by all schemas
+_class_calls = weakref.WeakValueDictionary()
+
+
 def ensure_trafaret(trafaret):
     """
     Helper for complex trafarets, takes trafaret instance or class
@@ -194,7 +263,10 @@ def ensure_trafaret(trafaret):
             return trafaret()
         # str, int, float are classes, but its appropriate to use them
         # as trafaret functions
-        return Call(lambda val: trafaret(val))
+        call = _class_calls.get(trafaret)
+        if call is None:
+            call = _class_calls[trafaret] = Call(lambda val: trafaret(val))
+        return call
     elif callable(trafaret):
         return Call(trafaret)
     else:
@@ -212,6 +284,7 @@ class TypingTrafaret(Trafaret):
     """A trafaret used for instance type and class inheritance checks."""
 
     __metaclass__ = TypeMeta
+    __slots__ = ['type_']
 
     def __init__(self, type_):
         self.type_ = type_
@@ -240,6 +313,7 @@ class Subclass(TypingTrafaret):
     >>> extract_error(s, object)
     'value is not subclass of type'
     """
+    __slots__ = ()
 
     typing_checker = issubclass
     failure_message = "value is not subclass of %s"
@@ -260,11 +334,21 @@ class Type(TypingTrafaret):
     >>> c.is_valid("foo")
     False
     """
+    __slots__ = ()
 
     typing_checker = isinstance
     failure_message = "value is not %s"
     code = "is_not_instance"
 
+    def bulk_check(self, values):
+        """
+        `List` fast path, items of exactly this type pass in one scan
+        """
+        type_ = self.type_
+        if type(self) is Type and all(type(value) is type_ for value in values):
+            return list(values)
+        return None
+
 
 class Any(Trafaret):
     """
@@ -272,10 +356,17 @@ class Any(Trafaret):
     <Any>
     >>> (Any() >> ignore).check(object())
     """
+    __slots__ = ()
 
     def check_value(self, value):
         pass
 
+    def bulk_check(self, values):
+        """
+        `List` fast path, any items pass as is
+        """
+        return list(values) if type(self) is Any else None
+
     def __repr__(self):
         return "<Any>"
 
@@ -299,19 +390,100 @@ class Or(Trafaret, OrAsyncMixin):
     False
     """
 
-    __slots__ = ['trafarets']
+    __slots__ = ['trafarets', '_none_matches', '_alternatives', '_accepted_types']
 
     def __init__(self, *trafarets):
         self.trafarets = [ensure_trafaret(t) for t in trafarets]
+        self._alternatives = [
+            (t, t._accepted_types if t._trusted_hints else None)
+            for t in self.trafarets
+        ]
+        # `a | b | c` is nested `Or`, so outer one can skip inner one too
+        self._accepted_types = None
+        if all(types is not None for _, types in self._alternatives):
+            self._accepted_types = tuple(
+                tp
+                for _, types in self._alternatives
+                for tp in (types if isinstance(types, tuple) else (types,))
+            )
+        # optional field like `String | Null` gets None without
+        # raising and collecting errors of alternatives before `Null`
+        self._none_matches = False
+        for trafaret in self.trafarets:
+            if type(trafaret) is Null:
+                self._none_matches = True
+                break
+            if not (trafaret._trusted_hints and trafaret._rejects_none):
+                break
 
     def transform(self, value, context=None):
-        errors = []
-        for trafaret in self.trafarets:
+        if value is None and self._none_matches:
+            return None
+        errors = {}
+        for idx, (trafaret, types) in enumerate(self._alternatives):
+            if types is not None and not isinstance(value, types):
+                errors[idx] = None
+                continue
             try:
                 return trafaret(value, context=context)
             except DataError as e:
-                errors.append(e)
-        raise self._failure(dict(enumerate(errors)), code=codes.NOTHING_MATCH)
+                errors[idx] = e
+        return self._nothing_match(errors, value, context=context)
+
+    def _nothing_match(self, errors, value, context=None):
+        """
+        Fails with errors of all alternatives. Alternatives skipped by type
+        are called now to get their errors, same as without skipping.
+        """
+        for idx, error in errors.items():
+            if error is None:
+                try:
+                    return self.trafarets[idx](value, context=context)
+                except DataError as e:
+                    errors[idx] = e
+        self._failure(errors, code=codes.NOTHING_MATCH)
+
+    def compile(self):
+        """
+        Returns generated function with the same behaviour as `check`,
+        trying compiled alternatives one after another until first match.
+        Subclasses use plain `check`. Result is cached, trafarets are immutable.
+        """
+        if type(self) is not Or:
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        namespace = {
+            'DataError': DataError,
+            'codes': codes,
+            '_nothing_match': self._nothing_match,
+        }
+        lines = ['def or_check(value, context=None):']
+        if self._none_matches:
+            lines.extend([
+                '    if value is None:',
+                '        return None',
+            ])
+        for idx, (trafaret, types) in enumerate(self._alternatives):
+            namespace['_t%d' % idx] = trafaret.compile()
+            indent = '    '
+            if types is not None:
+                namespace['_a%d' % idx] = types
+                lines.append('    e%d = None' % idx)
+                lines.append('    if isinstance(value, _a%d):' % idx)
+                indent = '        '
+            lines.extend([
+                indent + 'try:',
+                indent + '    return _t%d(value, context=context)' % idx,
+                indent + 'except DataError as err:',
+                indent + '    e%d = err' % idx,
+            ])
+        lines.append('    return _nothing_match({%s}, value, context=context)' % ', '.join(
+            '%d: e%d' % (idx, idx) for idx in range(len(self.trafarets))
+        ))
+        self._compiled = compile_function('or_check', '\n'.join(lines), namespace)
+        return self._compiled
 
     def __repr__(self):
         return "<Or(%s)>" % (", ".join(repr(t) for t in self.trafarets))
@@ -332,6 +504,25 @@ class And(Trafaret, AndAsyncMixin):
         res = self.trafaret(value, context=context)
         return self.other(res, context=context)
 
+    def compile(self):
+        """
+        Returns function with the same behaviour as `check`, calling
+        compiled trafarets directly. Subclasses use plain `check`.
+        Result is cached.
+        """
+        if type(self) is not And:
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        first = self.trafaret.compile()
+        other = self.other.compile()
+
+        def and_check(value, context=None):
+            return other(first(value, context=context), context=context)
+        self._compiled = and_check
+        return self._compiled
+
     def __repr__(self):
         return "<And(%s, %s)>" % (
             repr(self.trafaret),
@@ -351,6 +542,8 @@ class Null(Trafaret):
     >>> Null().is_valid(1)
     False
     """
+    __slots__ = ()
+    _accepted_types = (type(None),)
 
     def check_value(self, value):
         if value is not None:
@@ -377,11 +570,22 @@ class Bool(Trafaret):
     >>> Null().is_valid(1)
     False
     """
+    __slots__ = ()
+    _rejects_none = True
+    _accepted_types = (bool,)
 
     def check_value(self, value):
         if not isinstance(value, bool):
             self._failure("value should be True or False", value=value, code=codes.IS_NOT_BOOL)
 
+    def bulk_check(self, values):
+        """
+        `List` fast path, list of bools passes in one scan
+        """
+        if type(self) is Bool and all(type(value) is bool for value in values):
+            return list(values)
+        return None
+
     def __repr__(self):
         return "<Bool>"
 
@@ -413,12 +617,15 @@ class ToBool(Trafaret):
     >>> ToBool().check(False)
     False
     """
+    __slots__ = ()
 
-    true_values = ('t', 'true', 'y', 'yes', 'on', '1', '1.0')
-    false_values = ('false', 'n', 'no', 'off', '0', 'none', '0.0')
-    convertable = true_values + false_values
+    true_values = frozenset(('t', 'true', 'y', 'yes', 'on', '1', '1.0'))
+    false_values = frozenset(('false', 'n', 'no', 'off', '0', 'none', '0.0'))
+    convertable = true_values | false_values
 
     def check_and_return(self, value):
+        if type(value) is bool:
+            return value
         _value = str(value).strip().lower()
         if _value not in self.convertable:
             self._failure(
@@ -426,7 +633,7 @@ class ToBool(Trafaret):
                 value=value,
                 code=codes.IS_NOT_CONVERTIBLE_TO_BOOL,
             )
-        return _value in ('t', 'true', 'y', 'yes', 'on', '1', '1.0')
+        return _value in self.true_values
 
     def __repr__(self):
         return "<ToBool>"
@@ -490,6 +697,7 @@ class String(Trafaret):
     >>> String().is_valid(1)
     False
     """
+    _rejects_none = True
     str_type = STR_TYPE
 
     TYPE_ERROR_MESSAGE = "value is not a string"
@@ -502,13 +710,17 @@ class String(Trafaret):
         self.min_length = min_length
         self.max_length = max_length
 
+    @property
+    def _accepted_types(self):
+        return self.str_type
+
     def check_and_return(self, value):
         if not isinstance(value, self.str_type):
             self._failure(self.TYPE_ERROR_MESSAGE, value=value, code=self.TYPE_ERROR_CODE)
-        if not self.allow_blank and len(value) == 0:
+        if not value:
+            if self.allow_blank:
+                return value
             self._failure("blank value is not allowed", value=value, code=codes.EMPTY_STRING)
-        elif self.allow_blank and len(value) == 0:
-            return value
         if self.min_length is not None and len(value) < self.min_length:
             self._failure(
                 'String is shorter than %s characters' % self.min_length,
@@ -523,6 +735,18 @@ class String(Trafaret):
             )
         return value
 
+    def bulk_check(self, values):
+        """
+        `List` fast path for strings without length limits, one scan
+        """
+        if type(self) is not String or self.min_length is not None or self.max_length is not None:
+            return None
+        if self.allow_blank:
+            valid = all(type(value) is str for value in values)
+        else:
+            valid = all(type(value) is str and value for value in values)
+        return list(values) if valid else None
+
     def __repr__(self):
         return "<String(blank)>" if self.allow_blank else "<String>"
 
@@ -553,6 +777,8 @@ class Date(Trafaret):
     >>> Date().is_valid(1564077758)
     False
     """
+    __slots__ = ['_format']
+    _rejects_none = True
 
     def __init__(self, format='%Y-%m-%d'):
         self._format = format
@@ -599,6 +825,7 @@ class ToDate(Date):
     >>> ToDate(format='%y-%m-%d').check('00-01-01')
     datetime.date(2000, 1, 1)
     """
+    __slots__ = ()
 
     def check_and_return(self, data):
         return self._check(data)
@@ -629,6 +856,8 @@ class DateTime(Trafaret):
     False
 
     """
+    __slots__ = ['_format']
+    _rejects_none = True
 
     def __init__(self, format='%Y-%m-%d %H:%M:%S'):
         self._format = format
@@ -669,6 +898,7 @@ class ToDateTime(DateTime):
     >>> DateTime('%Y-%m-%d %H:%M').check("2019-07-25 21:45")
     datetime.datetime(2019, 7, 25, 21, 45)
     """
+    __slots__ = ()
 
     def check_and_return(self, value):
         return self._check(value)
@@ -686,6 +916,9 @@ class Bytes(String):
 
 class ToBytes(Trafaret):
     """Get str and try to encode it with given encoding, utf-8 by default."""
+    __slots__ = ['encoding']
+    _rejects_none = True
+
     def __init__(self, encoding='utf-8'):
         self.encoding = encoding
 
@@ -720,6 +953,9 @@ class FromBytes(Trafaret):
     """ Get bytes and try to decode it with given encoding, utf-8 by default.
     It can be used like ``unicode_or_koi8r = String | FromBytes(encoding='koi8r')``
     """
+    __slots__ = ['encoding']
+    _rejects_none = True
+
     def __init__(self, encoding='utf-8'):
         self.encoding = encoding
 
@@ -818,12 +1054,15 @@ class Iterable(Trafaret, ListAsyncMixin):
     """
 
     __metaclass__ = SquareBracketsMeta
-    __slots__ = ['trafaret', 'min_length', 'max_length']
+    _rejects_none = True
+    __slots__ = ['trafaret', 'min_length', 'max_length', '_bulk_check']
 
     def __init__(self, trafaret, min_length=0, max_length=None):
         self.trafaret = ensure_trafaret(trafaret)
         self.min_length = min_length
         self.max_length = max_length
+        # item trafaret can check whole list at once, see `ToInt`
+        self._bulk_check = getattr(self.trafaret, 'bulk_check', None)
 
     def check_common(self, value):
         if not isinstance(value, AbcIterable):
@@ -847,6 +1086,10 @@ class Iterable(Trafaret, ListAsyncMixin):
 
     def transform(self, value, context=None):
         self.check_common(value)
+        if self._bulk_check is not None:
+            lst = self._bulk_check(value)
+            if lst is not None:
+                return lst
         lst = []
         errors = {}
         for index, item in enumerate(value):
@@ -858,6 +1101,52 @@ class Iterable(Trafaret, ListAsyncMixin):
             raise self._failure(errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return lst
 
+    def compile(self):
+        """
+        Returns generated function with the same behaviour as `check`,
+        with item trafaret and helpers bound to locals. Subclasses can
+        change checks, so they use plain `check`.
+        Result is cached, trafarets are immutable.
+        """
+        if type(self) not in (Iterable, List):
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        namespace = {
+            'DataError': DataError,
+            'codes': codes,
+            '_check_common': self.check_common,
+            '_failure': self._failure,
+            '_check': self.trafaret.compile(),
+            '_bulk_check': self._bulk_check,
+        }
+        lines = [
+            'def list_check(value, context=None):',
+            '    _check_common(value)',
+        ]
+        if self._bulk_check is not None:
+            lines.extend([
+                '    lst = _bulk_check(value)',
+                '    if lst is not None:',
+                '        return lst',
+            ])
+        lines.extend([
+            '    lst = []',
+            '    append = lst.append',
+            '    errors = {}',
+            '    for index, item in enumerate(value):',
+            '        try:',
+            '            append(_check(item, context=context))',
+            '        except DataError as err:',
+            '            errors[index] = err',
+            '    if errors:',
+            '        _failure(errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)',
+            '    return lst',
+        ])
+        self._compiled = compile_function('list_check', '\n'.join(lines), namespace)
+        return self._compiled
+
     def __repr__(self):
         r = "<List("
         options = []
@@ -874,6 +1163,8 @@ class Iterable(Trafaret, ListAsyncMixin):
 
 
 class List(Iterable):
+    __slots__ = ()
+
     def check_common(self, value):
         if not isinstance(value, list):
             self._failure(
@@ -897,6 +1188,7 @@ class Tuple(Trafaret, TupleAsyncMixin):
     <Tuple(<Int>, <Int>, <String>)>
     """
     __slots__ = ['trafarets', 'length']
+    _rejects_none = True
 
     def __init__(self, *args):
         self.trafarets = [ensure_trafaret(t) for t in args]
@@ -931,6 +1223,45 @@ class Tuple(Trafaret, TupleAsyncMixin):
             self._failure(errors, value=value, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return tuple(result)
 
+    def compile(self):
+        """
+        Returns generated function with the same behaviour as `check`,
+        with a line per tuple item instead of `zip` and `enumerate` loop.
+        Subclasses use plain `check`. Result is cached, trafarets are immutable.
+        """
+        if type(self) is not Tuple:
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        namespace = {
+            'DataError': DataError,
+            'codes': codes,
+            '_check_common': self.check_common,
+            '_failure': self._failure,
+        }
+        lines = [
+            'def tuple_check(value, context=None):',
+            '    _check_common(value)',
+            '    items = tuple(value)',
+            '    errors = {}',
+        ]
+        for idx, trafaret in enumerate(self.trafarets):
+            namespace['_t%d' % idx] = trafaret.compile()
+            lines.extend([
+                '    try:',
+                '        r%d = _t%d(items[%d], context=context)' % (idx, idx, idx),
+                '    except DataError as err:',
+                '        errors[%d] = err' % idx,
+            ])
+        lines.extend([
+            '    if errors:',
+            '        _failure(errors, value=value, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)',
+            '    return (%s)' % ''.join('r%d, ' % idx for idx in range(self.length)),
+        ])
+        self._compiled = compile_function('tuple_check', '\n'.join(lines), namespace)
+        return self._compiled
+
     def __repr__(self):
         return '<Tuple(' + ', '.join(repr(t) for t in self.trafarets) + ')>'
 
@@ -962,24 +1293,26 @@ class Key(KeyAsyncMixin):
         self.trafaret = ensure_trafaret(trafaret) if trafaret else Any()
 
     def __call__(self, data, context=None):
-        if self.name in data or self.default is not _empty:
-            if callable(self.default):
-                default = self.default()
-            else:
-                default = self.default
+        # attributes are read once, keys can be changed after creation
+        # with `>>` or `set_trafaret`, so nothing is cached on instance
+        name = self.name
+        default = self.default
+        if name in data or default is not _empty:
+            if callable(default):
+                default = default()
             error = None
             try:
-                result = self.trafaret(self.get_data(data, default), context=context)
+                result = self.trafaret.check(self.get_data(data, default), context=context)
             except DataError as de:
                 error = de
             if error:
-                yield self.name, error, (self.name,)
+                yield name, error, (name,)
             else:
-                yield self.get_name(), result, (self.name,)
+                yield self.get_name(), result, (name,)
             return
 
         if not self.optional:
-            yield self.name, DataError(error='is required', code=codes.REQUIRED), (self.name,)
+            yield name, DataError(error='is required', code=codes.REQUIRED), (name,)
 
     def get_data(self, data, default):
         return data.get(self.name, default)
@@ -1052,8 +1385,18 @@ class Dict(Trafaret, DictAsyncMixin):
     `allow_extra_trafaret` or `Any`.
 
     `ignore_extra` argument can be a list of keys, or `'*'` for any, that will be ignored.
+
+    `extras` and `ignore` lists of Dict are read once, on `compile` or when the first
+    value with unknown keys is checked, so treat them as read only. Use `allow_extra`
+    and `ignore_extra` methods to get Dict with other lists.
     """
-    __slots__ = ['extras', 'extras_trafaret', 'allow_any', 'ignore', 'ignore_any', 'keys', '_keys']
+
+    __slots__ = [
+        'extras', 'extras_trafaret', 'allow_any', 'ignore', 'ignore_any', 'keys', '_keys',
+        '_extras_set', '_ignore_set', '_key_runs', '_async_key_runs',
+    ]
+    _rejects_none = True
+    _accepted_types = (dict, AbcMapping)
 
     def __init__(self, *args, **trafarets):
         if args and isinstance(args[0], AbcMapping):
@@ -1086,6 +1429,23 @@ class Dict(Trafaret, DictAsyncMixin):
         self._keys = []
         for key in self.keys:
             self._keys.append(with_context_caller(key))
+        # plain `Key`s are checked inline in `transform`, without a generator
+        self._key_runs = [
+            (key if type(key) is Key else None, key_caller)
+            for key, key_caller in zip(self.keys, self._keys)
+        ]
+
+    def _extra_sets(self):
+        """
+        `extras` and `ignore` as sets for the unknown keys scan, that runs
+        for every input key. Made once, on first use.
+        """
+        try:
+            return self._extras_set, self._ignore_set
+        except AttributeError:
+            self._extras_set = frozenset(self.extras)
+            self._ignore_set = frozenset(self.ignore)
+            return self._extras_set, self._ignore_set
 
     def _clone_args(self):
         """ return args to create new Dict clone
@@ -1130,7 +1490,7 @@ class Dict(Trafaret, DictAsyncMixin):
         return self.__class__(*keys, **kw)
 
     def transform(self, value, context=None):
-        if not isinstance(value, AbcMapping):
+        if type(value) is not dict and not isinstance(value, AbcMapping):
             self._failure(
                 "value is not a dict",
                 value=value,
@@ -1138,22 +1498,44 @@ class Dict(Trafaret, DictAsyncMixin):
             )
         collect = {}
         errors = {}
-        touched_names = []
-        for key in self._keys:
-            for k, v, names in key(value, context=context):
-                if isinstance(v, DataError):
-                    errors[k] = v
-                else:
-                    collect[k] = v
-                touched_names.extend(names)
+        touched_names = set()
+        get = value.get
+        for key, key_caller in self._key_runs:
+            if key is None:
+                for k, v, names in key_caller(value, context=context):
+                    if isinstance(v, DataError):
+                        errors[k] = v
+                    else:
+                        collect[k] = v
+                    touched_names.update(names)
+                continue
+            # same as `Key.__call__`, with one `get` per key
+            name = key.name
+            default = key.default
+            if default is _empty:
+                item = get(name, _empty)
+                if item is _empty:
+                    if not key.optional:
+                        touched_names.add(name)
+                        errors[name] = DataError(error='is required', code=codes.REQUIRED)
+                    continue
+            else:
+                item = get(name, default() if callable(default) else default)
+            touched_names.add(name)
+            try:
+                collect[key.to_name or name] = key.trafaret.check(item, context=context)
+            except DataError as de:
+                errors[name] = de
 
-        if not self.ignore_any:
+        # usual case is no unknown keys, so one C-level check skips the loop
+        if not self.ignore_any and not touched_names.issuperset(value):
+            extras, ignore = self._extra_sets()
             for key in value:
                 if key in touched_names:
                     continue
-                if key in self.ignore:
+                if key in ignore:
                     continue
-                if not self.allow_any and key not in self.extras:
+                if not self.allow_any and key not in extras:
                     if key in collect:
                         errors[key] = DataError(
                             "%s key was shadowed" % key,
@@ -1178,6 +1560,114 @@ class Dict(Trafaret, DictAsyncMixin):
             self._failure(error=errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return collect
 
+    def compile(self):
+        """
+        Returns generated function with the same behaviour as `check`.
+
+        Plain `Key` instances are unrolled to straight-line code, any other
+        keys are called like in `check`. Extras handling is specialized for
+        this Dict options. Subclasses use plain `check`. Result is cached,
+        trafarets are immutable, so keys should not be changed after
+        compilation.
+        """
+        if type(self) is not Dict:
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        extras, ignore = self._extra_sets()
+        namespace = {
+            'AbcMapping': AbcMapping,
+            'DataError': DataError,
+            'codes': codes,
+            '_empty': _empty,
+            '_failure': self._failure,
+            '_extras_check': self.extras_trafaret.compile(),
+            '_extras': extras,
+            '_ignore': ignore,
+        }
+        lines = [
+            'def dict_check(value, context=None):',
+            '    if type(value) is not dict and not isinstance(value, AbcMapping):',
+            '        _failure("value is not a dict", value=value, code=codes.IS_NOT_A_DICT)',
+            '    collect = {}',
+            '    errors = {}',
+            '    touched_names = set()',
+            '    get = value.get',
+        ]
+        for idx, key in enumerate(self.keys):
+            if type(key) is not Key:
+                namespace['_k%d' % idx] = self._keys[idx]
+                lines.extend([
+                    '    for k, v, names in _k%d(value, context=context):' % idx,
+                    '        if isinstance(v, DataError):',
+                    '            errors[k] = v',
+                    '        else:',
+                    '            collect[k] = v',
+                    '        touched_names.update(names)',
+                ])
+                continue
+            namespace['_n%d' % idx] = key.name
+            namespace['_to%d' % idx] = key.get_name()
+            namespace['_t%d' % idx] = key.trafaret.compile()
+            namespace['_d%d' % idx] = key.default
+            # one bound `get` call instead of `in` check and `get`
+            if key.default is _empty:
+                lines.extend([
+                    '    v = get(_n%d, _empty)' % idx,
+                    '    if v is not _empty:',
+                ])
+            else:
+                default = ('_d%d()' if callable(key.default) else '_d%d') % idx
+                lines.extend([
+                    '    v = get(_n%d, %s)' % (idx, default),
+                    '    if True:',
+                ])
+            lines.extend([
+                '        try:',
+                '            collect[_to%d] = _t%d(v, context=context)' % (idx, idx),
+                '        except DataError as data_error:',
+                '            errors[_n%d] = data_error' % idx,
+                '        touched_names.add(_n%d)' % idx,
+            ])
+            if not key.optional and key.default is _empty:
+                lines.extend([
+                    '    else:',
+                    '        errors[_n%d] = DataError(error="is required", code=codes.REQUIRED)' % idx,
+                    '        touched_names.add(_n%d)' % idx,
+                ])
+        if not self.ignore_any:
+            lines.extend([
+                '    for key in (() if touched_names.issuperset(value) else value):',
+                '        if key in touched_names or key in _ignore:',
+                '            continue',
+            ])
+            if not self.allow_any:
+                lines.extend([
+                    '        if key not in _extras:',
+                    '            if key in collect:',
+                    '                errors[key] = DataError("%s key was shadowed" % key, code=codes.SHADOWED)',
+                    '            else:',
+                    '                errors[key] = DataError("%s is not allowed key" % key, code=codes.NOT_ALLOWED)',
+                    '            continue',
+                ])
+            lines.extend([
+                '        if key in collect:',
+                '            errors[key] = DataError("%s key was shadowed" % key, code=codes.SHADOWED)',
+                '        else:',
+                '            try:',
+                '                collect[key] = _extras_check(value[key])',
+                '            except DataError as de:',
+                '                errors[key] = de',
+            ])
+        lines.extend([
+            '    if errors:',
+            '        _failure(error=errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)',
+            '    return collect',
+        ])
+        self._compiled = compile_function('dict_check', '\n'.join(lines), namespace)
+        return self._compiled
+
     def __repr__(self):
         r = "<Dict("
         options = []
@@ -1190,10 +1680,9 @@ class Dict(Trafaret, DictAsyncMixin):
         r += ", ".join(options)
         if options:
             r += " | "
-        options = []
-        for key in sorted(self.keys, key=lambda k: repr(k)):
-            options.append(repr(key))
-        r += ", ".join(options)
+        # keys can be changed after creation, so repr is not cached,
+        # but each key repr is built only once
+        r += ", ".join(sorted(repr(key) for key in self.keys))
         r += ")>"
         return r
 
@@ -1205,7 +1694,8 @@ class Dict(Trafaret, DictAsyncMixin):
         extra = self.extras
         if isinstance(other, Dict):
             other_keys = other.keys
-            extra += other.extras
+            # new list, lists of `self` are not changed
+            extra = extra + other.extras
             ignore = '*' if (self.ignore_any or other.ignore_any) else self.ignore + other.ignore
         elif isinstance(other, (list, tuple)):
             other_keys = list(other)
@@ -1237,14 +1727,16 @@ class Mapping(Trafaret, MappingAsyncMixin):
     Mapping gets two trafarets as arguments, one for key and one for value,
     like `Mapping(t.Int, t.List(t.Str))`.
     """
+
     __slots__ = ['key', 'value']
+    _rejects_none = True
 
     def __init__(self, key, value):
         self.key = ensure_trafaret(key)
         self.value = ensure_trafaret(value)
 
     def transform(self, mapping, context=None):
-        if not isinstance(mapping, AbcMapping):
+        if type(mapping) is not dict and not isinstance(mapping, AbcMapping):
             self._failure(
                 "value is not a dict",
                 value=mapping,
@@ -1252,20 +1744,28 @@ class Mapping(Trafaret, MappingAsyncMixin):
             )
         checked_mapping = {}
         errors = {}
+        key_check = self.key.check
+        value_check = self.value.check
         for key, value in mapping.items():
-            pair_errors = {}
+            key_error = value_error = None
             try:
-                checked_key = self.key(key, context=context)
+                checked_key = key_check(key, context=context)
             except DataError as err:
-                pair_errors['key'] = err
+                key_error = err
             try:
-                checked_value = self.value(value, context=context)
+                checked_value = value_check(value, context=context)
             except DataError as err:
-                pair_errors['value'] = err
-            if pair_errors:
-                errors[key] = DataError(error=pair_errors, code=codes.PAIR_MEMBERS_DID_NOT_MATCH)
-            else:
+                value_error = err
+            if key_error is None and value_error is None:
                 checked_mapping[checked_key] = checked_value
+                continue
+            # pair errors dict is built only for failed pairs
+            pair_errors = {}
+            if key_error is not None:
+                pair_errors['key'] = key_error
+            if value_error is not None:
+                pair_errors['value'] = value_error
+            errors[key] = DataError(error=pair_errors, code=codes.PAIR_MEMBERS_DID_NOT_MATCH)
         if errors:
             self._failure(errors, code=codes.SOME_ELEMENTS_DID_NOT_MATCH)
         return checked_mapping
@@ -1288,12 +1788,24 @@ class Enum(Trafaret):
     >>> trafaret.is_valid(2)
     False
     """
-    __slots__ = ['variants']
+    __slots__ = ['variants', '_variants_set']
 
     def __init__(self, *variants):
         self.variants = variants[:]
+        try:
+            self._variants_set = frozenset(variants)
+        except TypeError:  # unhashable variants
+            self._variants_set = None
 
     def check_value(self, value):
+        # hash lookup for the usual match, `variants` scan gives final answer
+        variants_set = self._variants_set
+        if variants_set is not None:
+            try:
+                if value in variants_set:
+                    return
+            except TypeError:  # unhashable value
+                pass
         if value not in self.variants:
             self._failure(
                 "value doesn't match any variant",
@@ -1315,6 +1827,7 @@ class Callable(Trafaret):
     >>> Callable().is_valid(1)
     False
     """
+    __slots__ = ()
 
     def check_value(self, value):
         if not callable(value):
@@ -1343,7 +1856,7 @@ class Call(Trafaret, CallAsyncMixin):
     >>> extract_error(trafaret, "bar")
     'I want only foo!'
     """
-    __slots__ = ['fn']
+    __slots__ = ['fn', 'supports_context']
 
     def __init__(self, fn):
         if not callable(fn):
@@ -1386,6 +1899,7 @@ class Forward(Trafaret, ForwardAsyncMixin):
     >>> extract_error(empty_node, 'something')
     'trafaret not set yet'
     """
+    __slots__ = ['trafaret', '_recur_repr']
 
     def __init__(self):
         self.trafaret = None
@@ -1400,13 +1914,14 @@ class Forward(Trafaret, ForwardAsyncMixin):
         self.trafaret = ensure_trafaret(trafaret)
 
     def transform(self, value, context=None):
-        if self.trafaret is None:
+        trafaret = self.trafaret
+        if trafaret is None:
             self._failure(
                 'trafaret not set yet',
                 value=value,
                 code=codes.TRAFARET_IS_NOT_SET,
             )
-        return self.trafaret(value, context=context)
+        return trafaret.check(value, context=context)
 
     def __repr__(self):
         # XXX not threadsafe
@@ -1473,30 +1988,29 @@ def guard(trafaret=None, **kwargs):
         trafaret = Dict(**kwargs)
 
     def wrapper(fn):
+        # everything that depends only on `fn` signature is prepared once,
+        # guarded function is called far more often than decorated
         argspec = getargspec(fn)
+        fnargs = argspec.args
+        has_self = bool(fnargs) and fnargs[0] in ('self', 'cls')
+        if has_self:
+            fnargs = fnargs[1:]
+        defaults = dict(zip(reversed(fnargs), reversed(argspec.defaults or ())))
+        defaults.update(argspec.kwonlydefaults or {})
 
         @functools.wraps(fn)
         def decor(*args, **kwargs):
-            fnargs = argspec.args
-            if fnargs and fnargs[0] in ['self', 'cls']:
+            if has_self:
                 obj = args[0]
-                fnargs = fnargs[1:]
-                checkargs = args[1:]
-            else:
-                obj = None
-                checkargs = args
-
-            defaults = zip(reversed(fnargs), reversed(argspec.defaults or ()))
-            kw_only_defaults = (argspec.kwonlydefaults or {}).items()
-
+                args = args[1:]
+            call_args = dict(defaults)
+            call_args.update(zip(fnargs, args))
+            call_args.update(kwargs)
             try:
-                call_args = dict(
-                    itertools.chain(defaults, kw_only_defaults, zip(fnargs, checkargs), kwargs.items())
-                )
                 converted = trafaret(call_args)
             except DataError as err:
                 raise GuardError(error=err.error)
-            return fn(obj, **converted) if obj else fn(**converted)
+            return fn(obj, **converted) if has_self else fn(**converted)
         decor.__doc__ = "guarded with %r\n\n" % trafaret + (decor.__doc__ or "")
         return decor
     return wrapper
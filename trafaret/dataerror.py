@@ -1,6 +1,9 @@
 from .lib import _empty, STR_TYPES
 
 
+ERROR_TYPES = STR_TYPES + (dict, )
+
+
 class DataError(ValueError):
     """
     Error with data preserve
@@ -19,13 +22,13 @@ class DataError(ValueError):
         :attribute trafaret: trafaret raised error
         :attribute code: code for error, like `value_is_too_big`
         """
-        if not isinstance(error, STR_TYPES + (dict, )):
+        if type(error) not in ERROR_TYPES and not isinstance(error, ERROR_TYPES):
             raise RuntimeError('Only str or dict is supported, got %r' % error)
         self.error = error
         self.name = name
         self.value = value
         self.trafaret = trafaret
-        self.code = code or self.__class__.error_code
+        self.code = code or self.error_code
         # if self.code == 'unknown':
         #     raise RuntimeError()
 
@@ -42,10 +45,10 @@ class DataError(ValueError):
         if isinstance(self.error, dict):
             return {
                 'code': self.code,
-                'nested': dict(
-                    (k, v.to_struct(value=value) if isinstance(v, DataError) else v)
+                'nested': {
+                    k: v.to_struct(value=value) if isinstance(v, DataError) else v
                     for k, v in self.error.items()
-                ),
+                },
             }
         return {
             'code': self.code,
@@ -57,7 +60,7 @@ class DataError(ValueError):
         if not isinstance(self.error, dict):
             return self.__str__(value=value)
 
-        return dict(
-            (k, v.as_dict(value=value) if isinstance(v, DataError) else v)
+        return {
+            k: v.as_dict(value=value) if isinstance(v, DataError) else v
             for k, v in self.error.items()
-        )
+        }
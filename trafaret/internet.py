@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import re
-from .regexp import Regexp, RegexpString
+from .regexp import Regexp, RegexpString, MEMO_MAX_LENGTH
 from .base import String, FromBytes, OnError, WithRepr
-from .lib import py3
+from .dataerror import DataError
+from .lib import py3, lru_cache
 from . import codes
 
 if py3:
@@ -28,25 +29,85 @@ EMAIL_REGEXP = re.compile(
 )
 
 
+if hasattr(str, 'isascii'):
+    def is_ascii(value):
+        return value.isascii()
+else:  # pragma: no cover
+    def is_ascii(value):
+        try:
+            value.encode('ascii')
+        except UnicodeError:
+            return False
+        return True
+
+
+@lru_cache(maxsize=2048)
+def idna_encode(domain):
+    # IDNA is pure, so repeated domains can skip punycode entirely
+    return domain.encode('idna').decode('ascii')
+
+
+def to_ace(domain):
+    # ASCII domain is already in ACE form, no need to run IDNA codec
+    if is_ascii(domain):
+        return domain
+    return idna_encode(domain)
+
+
+def needs_idna(value):
+    # IDNA does not change ASCII value, so the retry with it would repeat
+    # the same failed check
+    if is_ascii(value):
+        return DataError('value does not need IDNA encoding')
+    return value
+
+
 def email_idna_encode(value):
     if '@' in value:
         parts = value.split('@')
-        parts[-1] = parts[-1].encode('idna').decode('ascii')
+        parts[-1] = to_ace(parts[-1])
         return '@'.join(parts)
     return value
 
 
+class MemoWithRepr(WithRepr):
+    """
+    `WithRepr` for context free string checks like `Email` and `URL`.
+    Successful results for short strings are memoized, failures are
+    checked again.
+    """
+    __slots__ = ['_memo_check']
+    memo_types = (type(u''), bytes)
+
+    def __init__(self, trafaret, representation, maxsize=1024):
+        super(MemoWithRepr, self).__init__(trafaret, representation)
+        # typed, so `'a'` and `u'a'` are different entries on python 2
+        self._memo_check = lru_cache(maxsize=maxsize, typed=True)(self.trafaret.check)
+
+    def cache_clear(self):
+        """
+        Drops memoized results
+        """
+        if hasattr(self._memo_check, 'cache_clear'):
+            self._memo_check.cache_clear()
+
+    def transform(self, value, context=None):
+        if type(value) in self.memo_types and len(value) <= MEMO_MAX_LENGTH:
+            return self._memo_check(value)
+        return self.trafaret(value, context=context)
+
+
 to_str = OnError(FromBytes('utf-8') | String(), 'value is not a string', code=codes.IS_NOT_A_STRING)
 
 
 email_regexp_trafaret = OnError(to_str & Regexp(EMAIL_REGEXP), 'value is not a valid email address')
-email_trafaret = (email_regexp_trafaret | (to_str & email_idna_encode & email_regexp_trafaret))
+email_trafaret = (email_regexp_trafaret | (to_str & needs_idna & email_idna_encode & email_regexp_trafaret))
 Email = to_str & OnError(
     String(max_length=MAX_EMAIL_LEN) & email_trafaret,
     'value is not a valid email address',
     code=codes.IS_NOT_VALID_EMAIL,
 )
-Email = WithRepr(Email, '<Email>')
+Email = MemoWithRepr(Email, '<Email>')
 
 
 class Hex(RegexpString):
@@ -66,7 +127,7 @@ class URLSafe(RegexpString):
 
 URL_REGEXP = re.compile(
     r'^(?:http|ftp)s?://'  # http:// or https://
-    r'(?:\S+(?::\S*)?@)?'  # user and password
+    r'(?:\S+@)?'  # user and password, `\S` covers `user:password` without backtracking
     r'(?:(?:[A-Z0-9](?:[A-Z0-9-_]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'  # domain...
     r'localhost|'  # localhost...
     r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
@@ -79,16 +140,16 @@ URLRegexp = to_str & Regexp(URL_REGEXP)
 
 def decode_url_idna(value):
     scheme, netloc, path, query, fragment = urlparse.urlsplit(value)
-    netloc = netloc.encode('idna').decode('ascii')  # IDN -> ACE
+    netloc = to_ace(netloc)  # IDN -> ACE
     return urlparse.urlunsplit((scheme, netloc, path, query, fragment))
 
 
 URL = OnError(
-    URLRegexp | (to_str & decode_url_idna & URLRegexp),
+    URLRegexp | (to_str & needs_idna & decode_url_idna & URLRegexp),
     'value is not URL',
     code=codes.IS_NOT_VALID_URL,
 )
-URL = WithRepr(URL, '<URL>')
+URL = MemoWithRepr(URL, '<URL>')
 
 
 IPv4 = OnError(
@@ -98,7 +159,7 @@ IPv4 = OnError(
     'value is not IPv4 address',
     code=codes.IS_NOT_IPv4,
 )
-IPv4 = WithRepr(IPv4, '<IPv4>')
+IPv4 = MemoWithRepr(IPv4, '<IPv4>')
 
 
 IPv6 = OnError(
@@ -124,8 +185,8 @@ IPv6 = OnError(
     'value is not IPv6 address',
     code=codes.IS_NOT_IPv6,
 )
-IPv6 = WithRepr(IPv6, '<IPv6>')
+IPv6 = MemoWithRepr(IPv6, '<IPv6>')
 
 
 IP = OnError(IPv4 | IPv6, 'value is not IP address', code=codes.IS_NOT_IP)
-IP = WithRepr(IP, '<IP>')
+IP = MemoWithRepr(IP, '<IP>')
@@ -10,6 +10,11 @@ except ImportError:  # pragma: no cover
         Mapping as AbcMapping,
         Iterable,
     )
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+    def lru_cache(maxsize=128, typed=False):
+        return lambda fn: fn
 
 
 py3 = sys.version_info[0] == 3
@@ -31,7 +36,8 @@ def py3metafix(cls):
     if not py3:  # pragma: no cover
         return cls
     else:
-        newcls = cls.__metaclass__(cls.__name__, (cls,), {})
+        # empty slots, so the wrapper does not add `__dict__` to instances
+        newcls = cls.__metaclass__(cls.__name__, (cls,), {'__slots__': ()})
         newcls.__doc__ = cls.__doc__
         return newcls
 
@@ -51,11 +57,24 @@ class WithoutContextCaller(WithContextCaller):
         return self.func(value)
 
 
+@lru_cache(maxsize=256)
+def function_args(fn):
+    """
+    Argument names of function, `__call__` of all keys of the same class
+    are inspected once
+    """
+    return getargspec(fn).args
+
+
 def with_context_caller(callble):
     if isinstance(callble, WithContextCaller):
         return callble
     if not inspect.isfunction(callble) and hasattr(callble, '__call__'):
-        args = getargspec(callble.__call__).args
+        call = getattr(type(callble), '__call__', None)
+        if inspect.isfunction(call) and '__call__' not in getattr(callble, '__dict__', ()):
+            args = function_args(call)
+        else:
+            args = getargspec(callble.__call__).args
     else:
         args = getargspec(callble).args
     if 'context' in args:
@@ -83,6 +102,16 @@ def get_callable_args(fn):
     return spec.args
 
 
+def compile_function(name, source, namespace):
+    """
+    Compiles generated `source` with `namespace` as globals
+    and returns function `name` defined there
+    """
+    code = compile(source, '<trafaret %s>' % name, 'exec')
+    exec(code, namespace)
+    return namespace[name]
+
+
 __all__ = (
     AbcMapping,
     Iterable,
@@ -91,8 +120,10 @@ __all__ = (
     getargspec,
     STR_TYPES,
     py3metafix,
+    lru_cache,
     WithContextCaller,
     WithoutContextCaller,
     with_context_caller,
     get_callable_args,
+    compile_function,
 )
@@ -2,6 +2,7 @@ import decimal
 import numbers
 from .base import Trafaret, TrafaretMeta
 from .lib import (
+    compile_function,
     py3metafix,
     STR_TYPES,
 )
@@ -83,23 +84,44 @@ class Float(Trafaret):
     """
 
     __metaclass__ = NumberMeta
+    __slots__ = ['gte', 'lte', 'gt', 'lt', '_bounded']
+    _rejects_none = True
 
-    convertable = STR_TYPES + (numbers.Real,)
+    # concrete types go first, `type(value) in convertable` finds them
+    # without the slow `numbers.Real` ABC check
+    convertable = STR_TYPES + (int, float, numbers.Real)
     value_type = float
+    whole_only = False
 
     def __init__(self, gte=None, lte=None, gt=None, lt=None):
         self.gte = gte
         self.lte = lte
         self.gt = gt
         self.lt = lt
+        self._bounded = not (gte is None and lte is None and gt is None and lt is None)
+
+    @property
+    def _accepted_types(self):
+        return (self.value_type,) + self.convertable
 
     def _converter(self, value):
-        if not isinstance(value, self.convertable):
+        convertable = self.convertable
+        if type(value) not in convertable and not isinstance(value, convertable):
             self._failure(
                 'value is not %s' % self.value_type.__name__,
                 value=value,
                 code=codes.WRONG_TYPE,
             )
+        if self.whole_only and isinstance(value, float) and not value.is_integer():
+            self._failure('value is not int', value=value, code=codes.IS_NOT_INT)
+        # empty form fields are the usual bad input, they fail
+        # without raising and catching ValueError from conversion
+        if type(value) in STR_TYPES and (not value or value.isspace()):
+            self._failure(
+                "value can't be converted to %s" % self.value_type.__name__,
+                value=value,
+                code=codes.IS_NOT_A_NUMBER,
+            )
         try:
             return self.value_type(value)
         except ValueError:
@@ -114,6 +136,8 @@ class Float(Trafaret):
             value = self._converter(data)
         else:
             value = data
+        if not self._bounded:
+            return value
         if self.gte is not None and value < self.gte:
             self._failure("value is less than %s" % self.gte, value=data, code=codes.TOO_SMALL)
         if self.lte is not None and value > self.lte:
@@ -128,6 +152,66 @@ class Float(Trafaret):
         self._check(data)
         return data
 
+    def bulk_check(self, values):
+        """
+        `List` fast path, one C-level scan for a list of exact `value_type`
+        items when there are no bounds. Returns None if values should be
+        checked one by one.
+        """
+        if type(self) not in (Float, ToFloat, Int, ToInt) or self.gte is not None \
+                or self.lte is not None or self.gt is not None or self.lt is not None:
+            return None
+        value_type = self.value_type
+        if all(type(value) is value_type for value in values):
+            return list(values)
+        return None
+
+    def compile(self):
+        """
+        Returns generated function with the same behaviour as `check`,
+        with only bounds that are set checked inline. Subclasses of
+        number trafarets can change checks, so they use plain `check`.
+        Result is cached.
+        """
+        if type(self) not in (Float, ToFloat, Int, ToInt):
+            return self.check
+        compiled = getattr(self, '_compiled', None)
+        if compiled is not None:
+            return compiled
+        namespace = {
+            'codes': codes,
+            '_failure': self._failure,
+            '_converter': self._converter,
+            '_value_type': self.value_type,
+        }
+        lines = [
+            'def number_check(data, context=None):',
+            '    if isinstance(data, _value_type):',
+            '        value = data',
+            '    else:',
+            '        value = _converter(data)',
+        ]
+        bounds = (
+            ('gte', '<', 'value is less than %s', 'TOO_SMALL'),
+            ('lte', '>', 'value is greater than %s', 'TOO_BIG'),
+            ('lt', '>=', 'value should be less than %s', 'TOO_BIG'),
+            ('gt', '<=', 'value should be greater than %s', 'TOO_SMALL'),
+        )
+        for name, operator, message, code in bounds:
+            bound = getattr(self, name)
+            if bound is None:
+                continue
+            namespace['_' + name] = bound
+            namespace['_%s_message' % name] = message % bound
+            lines.extend([
+                '    if value %s _%s:' % (operator, name),
+                '        _failure(_%s_message, value=data, code=codes.%s)' % (name, code),
+            ])
+        # plain Float and Int check without conversion
+        lines.append('    return %s' % ('value' if type(self) in (ToFloat, ToInt) else 'data'))
+        self._compiled = compile_function('number_check', '\n'.join(lines), namespace)
+        return self._compiled
+
     def __lt__(self, lt):
         return type(self)(gte=self.gte, lte=self.lte, gt=self.gt, lt=lt)
 
@@ -156,6 +240,8 @@ class ToFloat(Float):
     """Checks that value is a float.
     Or if value is a string converts this string to float
     """
+    __slots__ = ()
+
     def check_and_return(self, data):
         return self._check(data)
 
@@ -171,33 +257,73 @@ class Int(Float):
     >>> extract_error(Int(), 1 + 1j)
     'value is not int'
     """
+    __slots__ = ()
 
     value_type = int
-
-    def _converter(self, value):
-        if isinstance(value, float):
-            if not value.is_integer():
-                self._failure('value is not int', value=value, code=codes.IS_NOT_INT)
-        return super(Int, self)._converter(value)
+    # `_converter` fails for floats with fractional part
+    whole_only = True
 
 
 class ToInt(Int):
+    __slots__ = ()
+
     def check_and_return(self, data):
         return self._check(data)
 
+    def bulk_check(self, values):
+        """
+        Converts a list of strings with one `map(int, ...)` call, `List`
+        uses it as a fast path. Returns None if values should be checked
+        one by one, to get proper errors or bounds checks.
+        """
+        if type(self) is not ToInt or self.gte is not None or self.lte is not None \
+                or self.gt is not None or self.lt is not None:
+            return None
+        lst = super(ToInt, self).bulk_check(values)
+        if lst is not None:
+            return lst
+        if not all(type(value) is str for value in values):
+            return None
+        try:
+            return list(map(int, values))
+        except ValueError:
+            return None
+
 
 class ToDecimal(Float):
+    __slots__ = ()
     value_type = decimal.Decimal
+    # `Decimal(None)` raises TypeError, not DataError
+    _rejects_none = False
+    # `Decimal` converts tuples too
+    _accepted_types = None
 
     def check_and_return(self, data):
         return self._check(data)
 
-    def _converter(self, value):
-        try:
-            return self.value_type(value)
-        except (ValueError, decimal.InvalidOperation):
-            self._failure(
-                'value can\'t be converted to Decimal',
-                value=value,
-                code=codes.INVALID_DECIMAL,
-            )
+    def _check(self, data):
+        # conversion and bounds checks are fused here to skip
+        # the `_converter` dispatch and repeated attribute loads
+        if isinstance(data, decimal.Decimal):
+            value = data
+        else:
+            try:
+                value = decimal.Decimal(data)
+            except (ValueError, decimal.InvalidOperation):
+                self._failure(
+                    'value can\'t be converted to Decimal',
+                    value=data,
+                    code=codes.INVALID_DECIMAL,
+                )
+        if not self._bounded:
+            return value
+        gte, lte, gt, lt = self.gte, self.lte, self.gt, self.lt
+        if gte is not None and value < gte:
+            self._failure("value is less than %s" % gte, value=data, code=codes.TOO_SMALL)
+        if lte is not None and value > lte:
+            self._failure("value is greater than %s" % lte, value=data, code=codes.TOO_BIG)
+        if lt is not None and value >= lt:
+            self._failure("value should be less than %s" % lt, value=data, code=codes.TOO_BIG)
+        if gt is not None and value <= gt:
+            self._failure("value should be greater than %s" % gt, value=data, code=codes.TOO_SMALL)
+        return value
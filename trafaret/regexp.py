@@ -1,23 +1,59 @@
 import re
 from .base import Trafaret, String
-from .lib import STR_TYPES
+from .lib import STR_TYPES, lru_cache
 from . import codes
 
 
+# longer values are matched without memoization, to not keep big texts
+MEMO_MAX_LENGTH = 256
+
+
+@lru_cache(maxsize=256)
+def compile_regexp(regexp, re_flags=0):
+    """
+    Trafarets like `Hex()` are created with the same pattern again and again,
+    sometimes right in request handlers, so compiled patterns are shared
+    """
+    return re.compile(regexp, re_flags)
+
+
+@lru_cache(maxsize=256)
+def memo_match(regexp):
+    """
+    Memoized `match` of compiled pattern, shared by trafarets with this pattern
+    """
+    return lru_cache(maxsize=1024)(regexp.match)
+
+
 class RegexpRaw(Trafaret):
     """
-    Check if given string match given regexp
+    Check if given string match given regexp.
+    Matches of short values are memoized, same emails, ids and
+    codes come again and again.
     """
-    __slots__ = ('regexp', 'raw_regexp')
+    __slots__ = ('regexp', 'raw_regexp', '_match', '_memo_match')
+    _rejects_none = True
 
     def __init__(self, regexp, re_flags=0):
-        self.regexp = re.compile(regexp, re_flags) if isinstance(regexp, STR_TYPES) else regexp
+        self.regexp = compile_regexp(regexp, re_flags) if isinstance(regexp, STR_TYPES) else regexp
         self.raw_regexp = self.regexp.pattern if self.regexp else None
+        self._match = self.regexp.match if self.regexp else None
+        self._memo_match = memo_match(self.regexp) if self.regexp else None
+
+    def cache_clear(self):
+        """
+        Drops memoized matches of this trafaret pattern
+        """
+        if hasattr(self._memo_match, 'cache_clear'):
+            self._memo_match.cache_clear()
 
     def check_and_return(self, value):
         if not isinstance(value, STR_TYPES):
             self._failure("value is not a string", value=value, code=codes.IS_NOT_A_STRING)
-        match = self.regexp.match(value)
+        if len(value) <= MEMO_MAX_LENGTH:
+            match = self._memo_match(value)
+        else:
+            match = self._match(value)
         if not match:
             self._failure('does not match pattern %s' % self.raw_regexp, value=value, code=codes.DOES_NOT_MATCH_RE)
         return match
@@ -27,6 +63,8 @@ class RegexpRaw(Trafaret):
 
 
 class Regexp(RegexpRaw):
+    __slots__ = ()
+
     def check_and_return(self, value):
         return super(Regexp, self).check_and_return(value).group()
 
@@ -1,8 +1,8 @@
 """
 There will be small helpers to render forms with exist trafarets for DRY.
 """
-from itertools import groupby
-from .lib import AbcMapping
+import re
+from .lib import AbcMapping, lru_cache, _empty
 
 
 def recursive_unfold(data, prefix='', delimeter='__'):
@@ -46,21 +46,63 @@ def unfold(data, prefix='', delimeter='__'):
     >>> _dd(unfold({'a': {'a': 4, 'b': 5}}, 'form'))
     "{'form__a__a': 4, 'form__a__b': 5}"
     """
-    return dict(recursive_unfold(data, prefix, delimeter))
+    # same walk as `recursive_unfold`, but without a generator per level
+    result = {}
+    _isinstance = isinstance
+    _str = str
+
+    def walk(data, prefix):
+        if _isinstance(data, AbcMapping):
+            items = data.items()
+        elif _isinstance(data, (list, tuple)):
+            items = enumerate(data)
+        else:
+            result[prefix] = data
+            return
+        head = prefix + delimeter if prefix else ''
+        for key, value in items:
+            walk(value, head + _str(key))
+
+    walk(data, prefix)
+    return result
+
+
+@lru_cache(maxsize=128)
+def split_regexp(delimeters):
+    """
+    Compiles delimeters to one alternation, longest delimeter first
+    """
+    return re.compile('|'.join(
+        re.escape(delimeter)
+        for delimeter in sorted(delimeters, key=len, reverse=True)
+    ))
 
 
 def split(str, delimeters):
+    """
+    >>> split('leads[delete][0][id]', ('[]', '[', ']'))
+    ['leads', 'delete', '0', 'id']
+    """
     if not delimeters:
         return [str]
-    rest = delimeters[1:]
+    if len(delimeters) == 1:
+        # plain str.split is faster than regexp for the default '__'
+        return [key for key in str.split(delimeters[0]) if key]
     return [
-        subkey
-        for key in str.split(delimeters[0])
-        for subkey in split(key, rest)
-        if subkey
+        key
+        for key in split_regexp(tuple(delimeters)).split(str)
+        if key
     ]
 
 
+@lru_cache(maxsize=4096)
+def split_path(key, delimeters):
+    """
+    Cached `split` for `fold`, same form keys come with every request
+    """
+    return tuple(split(key, delimeters))
+
+
 def fold(data, prefix='', delimeter='__'):
     """
     >>> _dd(fold({'a__a': 4}))
@@ -78,26 +120,58 @@ def fold(data, prefix='', delimeter='__'):
     """
     if not isinstance(delimeter, (tuple, list)):
         delimeter = (delimeter, )
-
-    def deep(data):
-        if len(data) == 1 and len(data[0][0]) < 2:
-            if data[0][0]:
-                return {data[0][0][0]: data[0][1]}
-            return data[0][1]
-
-        collect = {}
-        for key, group in groupby(data, lambda kv: kv[0][0]):
-            nest_data = [(k[1:], v) for k, v in group]
-            collect[key] = deep(nest_data)
-
-        is_num = all(k.isdigit() for k in collect.keys())
-        if is_num:
-            return [i[1] for i in sorted(collect.items())]
-        return collect
-
-    data_ = [
-        (split(key, delimeter), value)
-        for key, value in sorted(data.items())
-    ]
-    result = deep(data_)
+    delimeter = tuple(delimeter)
+
+    root = {}
+    branches = []
+    leaf_parents = set()
+    # bound methods are hoisted out of the loop, it runs for every form field
+    add_branch = branches.append
+    add_leaf_parent = leaf_parents.add
+    _split_path = split_path
+    _id = id
+    for key, value in sorted(data.items()):
+        path = _split_path(key, delimeter)
+        if not path:
+            return value
+        node = root
+        for part in path[:-1]:
+            if part not in node:
+                node[part] = {}
+                add_branch((node, part))
+            node = node[part]
+        node[path[-1]] = value
+        add_leaf_parent(_id(node))
+
+    def to_list(node):
+        # single value stays a dict, like {'a': {'0': 1}}
+        if len(node) == 1 and id(node) in leaf_parents:
+            return node
+        # path parts are never empty, so one isdigit over joined keys
+        # tells if all of them are digits
+        if not node or ''.join(node).isdigit():
+            try:
+                return to_dense_list(node) or [node[k] for k in sorted(node, key=int)]
+            except ValueError:
+                # superscripts and other digits `int` does not parse,
+                # such keys are ordered as strings
+                return [node[k] for k in sorted(node)]
+        return node
+
+    def to_dense_list(node):
+        # indexes usually are 0..n-1, then every value is written once
+        # to its own slot of preallocated list and no sort is needed
+        size = len(node)
+        result = [_empty] * size
+        for k, value in node.items():
+            idx = int(k)
+            if idx >= size or result[idx] is not _empty:
+                return None
+            result[idx] = value
+        return result
+
+    # children were created after parents, so reversed order goes bottom-up
+    for parent, part in reversed(branches):
+        parent[part] = to_list(parent[part])
+    result = to_list(root)
     return result[prefix] if prefix else result